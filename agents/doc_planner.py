@@ -7,8 +7,311 @@ This is the first step in the prompt chaining process.
 """
 
 import json
+import re
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Iterator, Any, Optional, Tuple
+
+# orjson is an optional, faster drop-in for the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, preferring orjson's C encoder."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+
+def _json_text(obj: Any) -> str:
+    """Serialize to an indented JSON string, preferring orjson's C encoder."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, default=str)
+
+
+def build_cached_messages(prompt: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Build Anthropic Messages API arguments for a section prompt.
+    
+    The invariant prefix is sent as a system block marked with an ephemeral
+    cache_control, so repeated section calls reuse the cached prefix.
+    
+    Args:
+        prompt: Section prompt parts from DocPlanner.generate_outline
+        
+    Returns:
+        Keyword arguments for ``client.messages.create``
+    """
+    return {
+        'system': [{
+            'type': 'text',
+            'text': prompt['cacheable_prefix'],
+            'cache_control': {'type': 'ephemeral'}
+        }],
+        'messages': [{'role': 'user', 'content': prompt['variable_suffix']}]
+    }
+
+
+# Web frameworks per dependency ecosystem, compiled into one alternation each
+# so a dependency name is lowercased and scanned once instead of per framework.
+_WEB_FRAMEWORK_PATTERNS = {
+    lang: re.compile('|'.join(re.escape(framework) for framework in frameworks))
+    for lang, frameworks in {
+        'python': ['flask', 'django', 'fastapi', 'tornado', 'pyramid'],
+        'node': ['express', 'koa', 'hapi', 'nestjs', 'fastify'],
+        'java': ['spring', 'jersey', 'dropwizard'],
+        'go': ['gin', 'echo', 'fiber', 'gorilla'],
+        'rust': ['actix', 'warp', 'rocket']
+    }.items()
+}
+
+# README section titles that indicate feature or installation docs
+_FEATURE_TITLE_RE = re.compile(r'feature|capability|function')
+_INSTALL_TITLE_RE = re.compile(r'install|setup|getting started')
+
+# Config files and package scripts that indicate a deployable project
+_DOCKER_RE = re.compile(r'docker', re.IGNORECASE)
+_DEPLOY_SCRIPT_RE = re.compile(r'deploy|build|start|serve')
+
+# Repository data keys included in each section's prompt, in output order
+_PROMPT_DATA_SLICES = {
+    'Project Overview': ('readme', 'languages'),
+    'Features': ('readme', 'languages'),
+    'Technology Stack': ('languages', 'dependencies'),
+    'Installation': ('dependencies', 'readme'),
+    'Configuration': ('config_files',),
+    'Project Structure': ('structure',),
+    'Testing': ('tests',),
+    'License': ('license',)
+}
+_DEFAULT_PROMPT_DATA_SLICE = ('languages', 'entry_points', 'readme')
+_PROMPT_DATA_DEFAULTS = {
+    'readme': {},
+    'languages': {},
+    'dependencies': {},
+    'config_files': [],
+    'structure': {},
+    'tests': {},
+    'license': None,
+    'entry_points': []
+}
+
+# Per-section writing instructions, stripped once at import
+_SECTION_INSTRUCTIONS = MappingProxyType({k: v.strip() for k, v in {
+    'Project Overview': """
+- Provide a clear, concise description of what the project does
+- Explain the problem it solves or need it addresses
+- Mention target audience or use cases
+- Keep it under 3 paragraphs""",
+    
+    'Features': """
+- List key features and capabilities
+- Use bullet points for clarity
+- Focus on user-facing functionality
+- Highlight unique or standout features""",
+    
+    'Technology Stack': """
+- List programming languages, frameworks, and major dependencies
+- Organize by category (backend, frontend, database, etc.)
+- Include version information where relevant
+- Explain why key technologies were chosen""",
+    
+    'Installation': """
+- Provide step-by-step installation instructions
+- Include prerequisites and system requirements
+- Cover different installation methods if applicable
+- Include verification steps""",
+    
+    'Configuration': """
+- Document environment variables and configuration options
+- Provide example configuration files
+- Explain required vs optional settings
+- Include security considerations""",
+    
+    'Usage': """
+- Provide basic usage examples
+- Include code snippets and command-line examples
+- Cover common use cases
+- Show expected output where helpful""",
+    
+    'API Documentation': """
+- Document all endpoints with HTTP methods
+- Include request/response examples
+- Document authentication requirements
+- Provide error codes and handling""",
+    
+    'Project Structure': """
+- Explain directory organization
+- Describe purpose of key files and folders
+- Use tree structure visualization
+- Highlight important entry points""",
+    
+    'Development': """
+- Explain development setup process
+- Document build and run procedures
+- Include debugging and testing workflows
+- Provide contribution guidelines""",
+    
+    'Testing': """
+- Explain how to run tests
+- Document test structure and organization
+- Include coverage information if available
+- Provide guidelines for writing new tests""",
+    
+    'Deployment': """
+- Provide deployment instructions for different environments
+- Include Docker/containerization if applicable
+- Document environment-specific configurations
+- Include monitoring and maintenance notes""",
+    
+    'License': """
+- State the license type clearly
+- Include any usage restrictions or requirements
+- Provide link to full license text
+- Mention third-party license considerations"""
+}.items()})
+_DEFAULT_SECTION_INSTRUCTION = "Generate comprehensive documentation for this section."
+
+# Section descriptors are built once at import and shared by every outline.
+# Consumers treat them as read-only, so sections only hold references.
+_LEADING_SECTIONS = (
+    {
+        'title': 'Project Summary & Goals',
+        'priority': 'high',
+        'required': True,
+        'description': 'Comprehensive project overview including goals, target audience, and primary objectives',
+        'subsections': ['Overview', 'Primary Goals', 'Target Audience', 'Success Metrics']
+    },
+    {
+        'title': 'Key Features & Use Cases',
+        'priority': 'high',
+        'required': True,
+        'description': 'Detailed feature breakdown with use cases and examples',
+        'subsections': ['Core Features', 'Use Cases', 'Feature Highlights', 'Capabilities Matrix']
+    },
+)
+
+_TECH_STACK_SECTION = {
+    'title': 'Technology Stack',
+    'priority': 'high',
+    'required': True,
+    'description': 'Comprehensive breakdown of technologies, frameworks, libraries, and tools',
+    'subsections': ['Frontend Framework', '3D Graphics & Animation', 'Development Tools', 'File Breakdown', 'Architecture Overview']
+}
+
+_SETUP_SECTIONS = (
+    {
+        'title': 'Setup Instructions',
+        'priority': 'high',
+        'required': True,
+        'description': 'Comprehensive installation and setup guide with prerequisites and troubleshooting',
+        'subsections': ['Prerequisites', 'System Requirements', 'Step-by-Step Installation', 'Verification', 'Troubleshooting Installation']
+    },
+    {
+        'title': 'Configuration Required',
+        'priority': 'high',
+        'required': True,
+        'description': 'Detailed configuration setup including environment variables and framework configurations',
+        'subsections': ['Environment Variables', 'TypeScript Configuration', 'Build Configuration', 'Development Settings']
+    },
+    {
+        'title': 'Usage',
+        'priority': 'high',
+        'required': True,
+        'description': 'How to use the project with examples'
+    },
+)
+
+_API_SECTION = {
+    'title': 'API Documentation',
+    'priority': 'high',
+    'required': True,
+    'description': 'API endpoints, request/response formats'
+}
+
+_TRAILING_SECTIONS = (
+    {
+        'title': 'Project Structure',
+        'priority': 'high',
+        'required': True,
+        'description': 'Detailed directory structure with descriptions and file organization',
+        'subsections': ['Directory Tree', 'Directory Descriptions', 'Key Files', 'Asset Organization']
+    },
+    {
+        'title': 'Major Components & Modules',
+        'priority': 'high',
+        'required': True,
+        'description': 'Detailed breakdown of core application components and their responsibilities',
+        'subsections': ['Core Application Components', 'Data Management', 'Architecture Patterns', 'Module Dependencies']
+    },
+    {
+        'title': 'Execution Plan',
+        'priority': 'medium',
+        'required': True,
+        'description': 'Step-by-step execution workflow and operational procedures',
+        'subsections': ['Development Workflow', 'Build Process', 'Testing Strategy', 'Deployment Pipeline']
+    },
+    {
+        'title': 'Development Workflow',
+        'priority': 'medium',
+        'required': True,
+        'description': 'Comprehensive development guidelines and best practices',
+        'subsections': ['Development Environment', 'Code Standards', 'Git Workflow', 'Review Process']
+    },
+    {
+        'title': 'Testing Strategy',
+        'priority': 'medium',
+        'required': True,
+        'description': 'Comprehensive testing approach including unit, integration, and end-to-end testing',
+        'subsections': ['Testing Framework', 'Test Types', 'Running Tests', 'Coverage Reports', 'CI/CD Integration']
+    },
+    {
+        'title': 'Deployment Checklist',
+        'priority': 'medium',
+        'required': True,
+        'description': 'Complete deployment guide with pre-deployment checks and post-deployment verification',
+        'subsections': ['Pre-deployment Checks', 'Deployment Steps', 'Environment Configuration', 'Monitoring Setup', 'Rollback Procedures']
+    },
+    {
+        'title': 'Troubleshooting & Tips',
+        'priority': 'medium',
+        'required': True,
+        'description': 'Common issues, solutions, and best practices for development and deployment',
+        'subsections': ['Common Issues', 'Development Tips', 'Performance Tips', 'Debugging Guide', 'FAQ']
+    },
+    {
+        'title': 'Performance Optimization',
+        'priority': 'medium',
+        'required': True,
+        'description': 'Performance optimization strategies and monitoring techniques',
+        'subsections': ['Optimization Strategies', 'Monitoring Tools', 'Benchmarking', 'Caching Strategies', 'Resource Management']
+    },
+    {
+        'title': 'Contributing Guidelines',
+        'priority': 'low',
+        'required': True,
+        'description': 'Guidelines for contributing to the project including code standards and review process',
+        'subsections': ['Getting Started', 'Code Standards', 'Pull Request Process', 'Issue Reporting', 'Community Guidelines']
+    },
+)
+
+_LICENSE_SECTION = {
+    'title': 'License',
+    'priority': 'low',
+    'required': False,
+    'description': 'License information and terms'
+}
 
 
 class DocPlanner:
@@ -18,6 +321,11 @@ class DocPlanner:
         self.prompts_dir = Path(prompts_dir)
         self.prompts_dir.mkdir(exist_ok=True)
         
+        # Serialized repo-data slices for the outline being generated
+        self._format_cache: Dict[Tuple[str, ...], str] = {}
+        self._last_repo_data: Optional[Dict[str, Any]] = None
+        self._dep_index: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+        
         # Standard documentation sections
         self.standard_sections = [
             "Project Overview",
@@ -35,8 +343,9 @@ class DocPlanner:
             "License"
         ]
         
-        # Initialize prompt templates
+        # Initialize prompt templates and load the meta-prompt once
         self._create_prompt_templates()
+        self._meta_prompt = self._load_meta_prompt()
     
     def generate_outline(self, repo_data: Dict[str, Any], ai_context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -51,8 +360,25 @@ class DocPlanner:
         """
         print("📋 Generating documentation outline...")
         
-        # Analyze repository to determine relevant sections
-        relevant_sections = self._analyze_relevant_sections(repo_data)
+        # Start each outline with fresh slice and dependency caches
+        self._format_cache = {}
+        self._last_repo_data = repo_data
+        self._dep_index = None
+        
+        # Derive project metadata once; every section prompt reuses it
+        derived = self._derive_metadata(repo_data)
+        
+        # The invariant prefix is identical for every section of this outline
+        cacheable_prefix = self._create_cacheable_prefix(repo_data, self._meta_prompt, derived)
+        
+        # Select relevant sections and build their prompts in a single pass
+        relevant_sections = []
+        prompts = {}
+        for section in self._iter_relevant_sections(repo_data, derived):
+            relevant_sections.append(section)
+            prompts[section['title']] = self._create_section_prompt(
+                section['title'], section, repo_data, ai_context, cacheable_prefix
+            )
         
         # Create outline structure
         outline = {
@@ -60,11 +386,11 @@ class DocPlanner:
             'sections': relevant_sections,
             'metadata': {
                 'generated_from': repo_data.get('path'),
-                'primary_language': self._get_primary_language(repo_data),
-                'project_type': self._detect_project_type(repo_data),
-                'complexity': self._assess_complexity(repo_data)
+                'primary_language': derived['primary_language'],
+                'project_type': derived['project_type'],
+                'complexity': derived['complexity']
             },
-            'prompts': self._generate_section_prompts(relevant_sections, repo_data, ai_context)
+            'prompts': prompts
         }
         
         # Save outline for reference
@@ -73,182 +399,62 @@ class DocPlanner:
         print(f"✅ Generated outline with {len(relevant_sections)} sections")
         return outline
     
-    def _analyze_relevant_sections(self, repo_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _derive_metadata(self, repo_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Analyze repository data to determine which sections are relevant.
+        Compute project metadata shared by the outline and all section prompts.
         
         Args:
             repo_data (Dict[str, Any]): Parsed repository data
             
         Returns:
-            List[Dict[str, Any]]: List of relevant sections with metadata
+            Dict[str, Any]: API flag, primary language, project type and complexity
+        """
+        is_api = self._is_api_project(repo_data)
+        primary_language = self._get_primary_language(repo_data)
+        
+        return {
+            'is_api': is_api,
+            'primary_language': primary_language,
+            'project_type': self._detect_project_type(repo_data, is_api, primary_language),
+            'complexity': self._assess_complexity(repo_data)
+        }
+    
+    def _iter_relevant_sections(self, repo_data: Dict[str, Any],
+                                derived: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze repository data to determine which sections are relevant.
+        
+        Args:
+            repo_data (Dict[str, Any]): Parsed repository data
+            derived (Dict[str, Any], optional): Precomputed project metadata
+            
+        Yields:
+            Dict[str, Any]: Relevant sections with metadata, in outline order
         """
-        sections = []
-        
-        # Always include basic sections with enhanced structure
-        sections.append({
-            'title': 'Project Summary & Goals',
-            'priority': 'high',
-            'required': True,
-            'description': 'Comprehensive project overview including goals, target audience, and primary objectives',
-            'subsections': ['Overview', 'Primary Goals', 'Target Audience', 'Success Metrics']
-        })
-        
-        # Enhanced Features section
-        sections.append({
-            'title': 'Key Features & Use Cases',
-            'priority': 'high',
-            'required': True,
-            'description': 'Detailed feature breakdown with use cases and examples',
-            'subsections': ['Core Features', 'Use Cases', 'Feature Highlights', 'Capabilities Matrix']
-        })
+        yield from _LEADING_SECTIONS
         
         # Enhanced Technology stack
         if repo_data.get('languages') or repo_data.get('dependencies'):
-            sections.append({
-                'title': 'Technology Stack',
-                'priority': 'high',
-                'required': True,
-                'description': 'Comprehensive breakdown of technologies, frameworks, libraries, and tools',
-                'subsections': ['Frontend Framework', '3D Graphics & Animation', 'Development Tools', 'File Breakdown', 'Architecture Overview']
-            })
-        
-        # Enhanced Setup Instructions section
-        sections.append({
-            'title': 'Setup Instructions',
-            'priority': 'high',
-            'required': True,
-            'description': 'Comprehensive installation and setup guide with prerequisites and troubleshooting',
-            'subsections': ['Prerequisites', 'System Requirements', 'Step-by-Step Installation', 'Verification', 'Troubleshooting Installation']
-        })
-        
-        # Enhanced Configuration section
-        sections.append({
-            'title': 'Configuration Required',
-            'priority': 'high',
-            'required': True,
-            'description': 'Detailed configuration setup including environment variables and framework configurations',
-            'subsections': ['Environment Variables', 'TypeScript Configuration', 'Build Configuration', 'Development Settings']
-        })
-        
-        # Usage section
-        sections.append({
-            'title': 'Usage',
-            'priority': 'high',
-            'required': True,
-            'description': 'How to use the project with examples'
-        })
+            yield _TECH_STACK_SECTION
+        
+        yield from _SETUP_SECTIONS
         
         # API Documentation for web services
-        if self._is_api_project(repo_data):
-            sections.append({
-                'title': 'API Documentation',
-                'priority': 'high',
-                'required': True,
-                'description': 'API endpoints, request/response formats'
-            })
-        
-        # Enhanced Project Structure section
-        sections.append({
-            'title': 'Project Structure',
-            'priority': 'high',
-            'required': True,
-            'description': 'Detailed directory structure with descriptions and file organization',
-            'subsections': ['Directory Tree', 'Directory Descriptions', 'Key Files', 'Asset Organization']
-        })
-        
-        # Major Components & Modules section
-        sections.append({
-            'title': 'Major Components & Modules',
-            'priority': 'high',
-            'required': True,
-            'description': 'Detailed breakdown of core application components and their responsibilities',
-            'subsections': ['Core Application Components', 'Data Management', 'Architecture Patterns', 'Module Dependencies']
-        })
-        
-        # Execution Plan section
-        sections.append({
-            'title': 'Execution Plan',
-            'priority': 'medium',
-            'required': True,
-            'description': 'Step-by-step execution workflow and operational procedures',
-            'subsections': ['Development Workflow', 'Build Process', 'Testing Strategy', 'Deployment Pipeline']
-        })
-        
-        # Enhanced Development section
-        sections.append({
-            'title': 'Development Workflow',
-            'priority': 'medium',
-            'required': True,
-            'description': 'Comprehensive development guidelines and best practices',
-            'subsections': ['Development Environment', 'Code Standards', 'Git Workflow', 'Review Process']
-        })
-        
-        # Enhanced Testing section
-        sections.append({
-            'title': 'Testing Strategy',
-            'priority': 'medium',
-            'required': True,
-            'description': 'Comprehensive testing approach including unit, integration, and end-to-end testing',
-            'subsections': ['Testing Framework', 'Test Types', 'Running Tests', 'Coverage Reports', 'CI/CD Integration']
-        })
-        
-        # Deployment Checklist section
-        sections.append({
-            'title': 'Deployment Checklist',
-            'priority': 'medium',
-            'required': True,
-            'description': 'Complete deployment guide with pre-deployment checks and post-deployment verification',
-            'subsections': ['Pre-deployment Checks', 'Deployment Steps', 'Environment Configuration', 'Monitoring Setup', 'Rollback Procedures']
-        })
-        
-        # Troubleshooting & Tips section
-        sections.append({
-            'title': 'Troubleshooting & Tips',
-            'priority': 'medium',
-            'required': True,
-            'description': 'Common issues, solutions, and best practices for development and deployment',
-            'subsections': ['Common Issues', 'Development Tips', 'Performance Tips', 'Debugging Guide', 'FAQ']
-        })
-        
-        # Performance Optimization section
-        sections.append({
-            'title': 'Performance Optimization',
-            'priority': 'medium',
-            'required': True,
-            'description': 'Performance optimization strategies and monitoring techniques',
-            'subsections': ['Optimization Strategies', 'Monitoring Tools', 'Benchmarking', 'Caching Strategies', 'Resource Management']
-        })
-        
-        # Contributing Guidelines section
-        sections.append({
-            'title': 'Contributing Guidelines',
-            'priority': 'low',
-            'required': True,
-            'description': 'Guidelines for contributing to the project including code standards and review process',
-            'subsections': ['Getting Started', 'Code Standards', 'Pull Request Process', 'Issue Reporting', 'Community Guidelines']
-        })
+        is_api = derived['is_api'] if derived else self._is_api_project(repo_data)
+        if is_api:
+            yield _API_SECTION
+        
+        yield from _TRAILING_SECTIONS
         
         # License section if license exists
         if repo_data.get('license'):
-            sections.append({
-                'title': 'License',
-                'priority': 'low',
-                'required': False,
-                'description': 'License information and terms'
-            })
-        
-        return sections
+            yield _LICENSE_SECTION
     
     def _has_features_info(self, repo_data: Dict[str, Any]) -> bool:
         """Check if repository has feature information."""
         readme = repo_data.get('readme', {})
-        if readme.get('sections'):
-            for section in readme['sections']:
-                title = section.get('title', '').lower()
-                if any(keyword in title for keyword in ['feature', 'capability', 'function']):
-                    return True
-        return False
+        return any(_FEATURE_TITLE_RE.search(section.get('title', '').lower())
+                   for section in readme.get('sections') or ())
     
     def _has_installation_info(self, repo_data: Dict[str, Any]) -> bool:
         """Check if repository has installation information."""
@@ -258,44 +464,17 @@ class DocPlanner:
         
         # Has installation info in README
         readme = repo_data.get('readme', {})
-        if readme.get('sections'):
-            for section in readme['sections']:
-                title = section.get('title', '').lower()
-                if any(keyword in title for keyword in ['install', 'setup', 'getting started']):
-                    return True
-        
-        return False
+        return any(_INSTALL_TITLE_RE.search(section.get('title', '').lower())
+                   for section in readme.get('sections') or ())
     
     def _is_api_project(self, repo_data: Dict[str, Any]) -> bool:
         """Detect if this is an API/web service project."""
         # Check for web frameworks in dependencies
-        dependencies = repo_data.get('dependencies', {})
-        
-        web_frameworks = {
-            'python': ['flask', 'django', 'fastapi', 'tornado', 'pyramid'],
-            'node': ['express', 'koa', 'hapi', 'nestjs', 'fastify'],
-            'java': ['spring', 'jersey', 'dropwizard'],
-            'go': ['gin', 'echo', 'fiber', 'gorilla'],
-            'rust': ['actix', 'warp', 'rocket']
-        }
+        dep_names = self._dependency_index(repo_data)['names']
         
-        for lang, frameworks in web_frameworks.items():
-            if lang in dependencies:
-                for dep_file, deps in dependencies[lang].items():
-                    if isinstance(deps, dict) and 'dependencies' in deps:
-                        deps_dict = deps['dependencies']
-                        if isinstance(deps_dict, dict):
-                            dep_names = list(deps_dict.keys())
-                        else:
-                            dep_names = []
-                    elif isinstance(deps, list):
-                        dep_names = deps
-                    else:
-                        continue
-                    
-                    for framework in frameworks:
-                        if any(framework in dep.lower() for dep in dep_names):
-                            return True
+        for lang, pattern in _WEB_FRAMEWORK_PATTERNS.items():
+            if lang in dep_names and pattern.search(dep_names[lang]):
+                return True
         
         # Check for API-related files
         api_indicators = ['api/', 'routes/', 'controllers/', 'endpoints/']
@@ -323,12 +502,8 @@ class DocPlanner:
             return True
         
         # Has development dependencies
-        dependencies = repo_data.get('dependencies', {})
-        for lang_deps in dependencies.values():
-            for dep_file, deps in lang_deps.items():
-                if isinstance(deps, dict) and 'dev_dependencies' in deps:
-                    if deps['dev_dependencies']:
-                        return True
+        if self._dependency_index(repo_data)['has_dev_dependencies']:
+            return True
         
         # Has development-related files
         dev_files = ['Makefile', 'docker-compose.yml', '.env.example']
@@ -339,35 +514,77 @@ class DocPlanner:
         """Check if project appears to be deployable."""
         # Has Docker files
         config_files = repo_data.get('config_files', [])
-        if any('docker' in f.lower() for f in config_files):
+        if any(_DOCKER_RE.search(f) for f in config_files):
             return True
         
         # Has deployment-related dependencies or scripts
-        dependencies = repo_data.get('dependencies', {})
-        for lang_deps in dependencies.values():
-            for dep_file, deps in lang_deps.items():
-                if isinstance(deps, dict) and 'scripts' in deps:
-                    scripts = deps['scripts']
-                    if any(keyword in script for script in scripts.keys() 
-                          for keyword in ['deploy', 'build', 'start', 'serve']):
-                        return True
+        scripts = self._dependency_index(repo_data)['scripts']
+        return bool(_DEPLOY_SCRIPT_RE.search(scripts))
+    
+    def _dependency_index(self, repo_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Flatten repo_data['dependencies'] in a single walk.
         
-        return False
+        Dependency and script names are joined into newline-separated strings
+        so each predicate runs one regex scan instead of a nested Python loop.
+        The index is kept until a different repo_data object is seen.
+        
+        Args:
+            repo_data: Repository data
+            
+        Returns:
+            Dict with lowercased dependency names per language, script names
+            and whether any dev dependencies are declared
+        """
+        if self._dep_index is not None and self._dep_index[0] is repo_data:
+            return self._dep_index[1]
+        
+        names = {}
+        scripts = []
+        has_dev_dependencies = False
+        
+        for lang, lang_deps in repo_data.get('dependencies', {}).items():
+            lang_names = []
+            for dep_file, deps in lang_deps.items():
+                if isinstance(deps, dict):
+                    if 'dependencies' in deps:
+                        deps_dict = deps['dependencies']
+                        if isinstance(deps_dict, dict):
+                            lang_names.extend(deps_dict)
+                    if deps.get('dev_dependencies'):
+                        has_dev_dependencies = True
+                    if 'scripts' in deps:
+                        scripts.extend(deps['scripts'])
+                elif isinstance(deps, list):
+                    lang_names.extend(deps)
+            names[lang] = '\n'.join(lang_names).lower()
+        
+        index = {
+            'names': names,
+            'scripts': '\n'.join(scripts),
+            'has_dev_dependencies': has_dev_dependencies
+        }
+        self._dep_index = (repo_data, index)
+        return index
     
     def _get_primary_language(self, repo_data: Dict[str, Any]) -> str:
         """Get the primary programming language."""
         languages = repo_data.get('languages', {})
         if languages:
-            return max(languages.keys(), key=lambda k: languages[k])
+            return max(languages.items(), key=itemgetter(1))[0]
         return 'unknown'
     
-    def _detect_project_type(self, repo_data: Dict[str, Any]) -> str:
+    def _detect_project_type(self, repo_data: Dict[str, Any], is_api: Optional[bool] = None,
+                             primary_lang: Optional[str] = None) -> str:
         """Detect the type of project."""
-        if self._is_api_project(repo_data):
+        if is_api is None:
+            is_api = self._is_api_project(repo_data)
+        if is_api:
             return 'web_api'
         
         languages = repo_data.get('languages', {})
-        primary_lang = self._get_primary_language(repo_data)
+        if primary_lang is None:
+            primary_lang = self._get_primary_language(repo_data)
         
         # Check for specific project types
         if 'html' in languages or 'css' in languages:
@@ -398,36 +615,45 @@ class DocPlanner:
         else:
             return 'complex'
     
-    def _generate_section_prompts(self, sections: List[Dict[str, Any]], 
-                                repo_data: Dict[str, Any], 
-                                ai_context: Dict[str, Any]) -> Dict[str, str]:
+    def _create_cacheable_prefix(self, repo_data: Dict[str, Any], meta_prompt: str,
+                                 derived: Dict[str, Any]) -> str:
         """
-        Generate specific prompts for each section.
+        Create the prompt prefix shared by all sections of a project.
+        
+        Everything that does not vary per section lives here so an LLM
+        client can mark it for prompt caching.
         
         Args:
-            sections: List of sections to generate
             repo_data: Repository data
-            ai_context: AI learning context
+            meta_prompt: Base meta-prompt template
+            derived: Project metadata computed once per outline
             
         Returns:
-            Dict mapping section titles to their prompts
+            Invariant prompt prefix
         """
-        prompts = {}
-        
-        # Load meta-prompt template
-        meta_prompt = self._load_meta_prompt()
-        
-        for section in sections:
-            title = section['title']
-            prompts[title] = self._create_section_prompt(
-                title, section, repo_data, ai_context, meta_prompt
-            )
+        # Base context
+        context = f"""
+Project: {repo_data.get('name', 'Unknown')}
+Primary Language: {derived['primary_language']}
+Project Type: {derived['project_type']}
+Complexity: {derived['complexity']}
+"""
         
-        return prompts
+        return f"""{meta_prompt}
+
+## Context
+{context}
+
+## Output Requirements
+- Write in clear, professional markdown
+- Include code examples where appropriate
+- Be concise but comprehensive
+- Follow technical writing best practices
+"""
     
     def _create_section_prompt(self, title: str, section: Dict[str, Any], 
                              repo_data: Dict[str, Any], ai_context: Dict[str, Any],
-                             meta_prompt: str) -> str:
+                             cacheable_prefix: str) -> Dict[str, str]:
         """
         Create a specific prompt for a documentation section.
         
@@ -436,28 +662,16 @@ class DocPlanner:
             section: Section metadata
             repo_data: Repository data
             ai_context: AI learning context
-            meta_prompt: Base meta-prompt template
+            cacheable_prefix: Invariant prefix shared by all sections
             
         Returns:
-            Formatted prompt for the section
+            Prompt split into its cacheable prefix and per-section suffix
         """
-        # Base context
-        context = f"""
-Project: {repo_data.get('name', 'Unknown')}
-Primary Language: {self._get_primary_language(repo_data)}
-Project Type: {self._detect_project_type(repo_data)}
-Complexity: {self._assess_complexity(repo_data)}
-"""
-        
         # Section-specific instructions
         section_instructions = self._get_section_instructions(title, repo_data)
         
-        # Combine into full prompt
-        prompt = f"""{meta_prompt}
-
-## Context
-{context}
-
+        # Per-section text always follows the invariant prefix
+        variable_suffix = f"""
 ## Section to Generate: {title}
 {section['description']}
 
@@ -466,15 +680,12 @@ Complexity: {self._assess_complexity(repo_data)}
 
 ## Repository Data
 {self._format_repo_data_for_prompt(repo_data, title)}
-
-## Output Requirements
-- Write in clear, professional markdown
-- Include code examples where appropriate
-- Be concise but comprehensive
-- Follow technical writing best practices
 """
         
-        return prompt
+        return {
+            'cacheable_prefix': cacheable_prefix,
+            'variable_suffix': variable_suffix
+        }
     
     def _get_section_instructions(self, title: str, repo_data: Dict[str, Any]) -> str:
         """
@@ -487,81 +698,7 @@ Complexity: {self._assess_complexity(repo_data)}
         Returns:
             Section-specific instructions
         """
-        instructions = {
-            'Project Overview': """
-- Provide a clear, concise description of what the project does
-- Explain the problem it solves or need it addresses
-- Mention target audience or use cases
-- Keep it under 3 paragraphs""",
-            
-            'Features': """
-- List key features and capabilities
-- Use bullet points for clarity
-- Focus on user-facing functionality
-- Highlight unique or standout features""",
-            
-            'Technology Stack': """
-- List programming languages, frameworks, and major dependencies
-- Organize by category (backend, frontend, database, etc.)
-- Include version information where relevant
-- Explain why key technologies were chosen""",
-            
-            'Installation': """
-- Provide step-by-step installation instructions
-- Include prerequisites and system requirements
-- Cover different installation methods if applicable
-- Include verification steps""",
-            
-            'Configuration': """
-- Document environment variables and configuration options
-- Provide example configuration files
-- Explain required vs optional settings
-- Include security considerations""",
-            
-            'Usage': """
-- Provide basic usage examples
-- Include code snippets and command-line examples
-- Cover common use cases
-- Show expected output where helpful""",
-            
-            'API Documentation': """
-- Document all endpoints with HTTP methods
-- Include request/response examples
-- Document authentication requirements
-- Provide error codes and handling""",
-            
-            'Project Structure': """
-- Explain directory organization
-- Describe purpose of key files and folders
-- Use tree structure visualization
-- Highlight important entry points""",
-            
-            'Development': """
-- Explain development setup process
-- Document build and run procedures
-- Include debugging and testing workflows
-- Provide contribution guidelines""",
-            
-            'Testing': """
-- Explain how to run tests
-- Document test structure and organization
-- Include coverage information if available
-- Provide guidelines for writing new tests""",
-            
-            'Deployment': """
-- Provide deployment instructions for different environments
-- Include Docker/containerization if applicable
-- Document environment-specific configurations
-- Include monitoring and maintenance notes""",
-            
-            'License': """
-- State the license type clearly
-- Include any usage restrictions or requirements
-- Provide link to full license text
-- Mention third-party license considerations"""
-        }
-        
-        return instructions.get(title, "Generate comprehensive documentation for this section.")
+        return _SECTION_INSTRUCTIONS.get(title, _DEFAULT_SECTION_INSTRUCTION)
     
     def _format_repo_data_for_prompt(self, repo_data: Dict[str, Any], section_title: str) -> str:
         """
@@ -574,42 +711,33 @@ Complexity: {self._assess_complexity(repo_data)}
         Returns:
             Formatted repository data string
         """
-        # Select relevant data based on section
-        relevant_data = {}
-        
-        if section_title in ['Project Overview', 'Features']:
-            relevant_data['readme'] = repo_data.get('readme', {})
-            relevant_data['languages'] = repo_data.get('languages', {})
-        
-        elif section_title == 'Technology Stack':
-            relevant_data['languages'] = repo_data.get('languages', {})
-            relevant_data['dependencies'] = repo_data.get('dependencies', {})
-        
-        elif section_title == 'Installation':
-            relevant_data['dependencies'] = repo_data.get('dependencies', {})
-            relevant_data['readme'] = repo_data.get('readme', {})
-        
-        elif section_title == 'Configuration':
-            relevant_data['config_files'] = repo_data.get('config_files', [])
-        
-        elif section_title == 'Project Structure':
-            relevant_data['structure'] = repo_data.get('structure', {})
-        
-        elif section_title == 'Testing':
-            relevant_data['tests'] = repo_data.get('tests', {})
-        
-        elif section_title == 'License':
-            relevant_data['license'] = repo_data.get('license')
-        
-        else:
-            # Include basic info for other sections
-            relevant_data = {
-                'languages': repo_data.get('languages', {}),
-                'entry_points': repo_data.get('entry_points', []),
-                'readme': repo_data.get('readme', {})
-            }
+        # Sections sharing a slice of repo data reuse its serialized form
+        if repo_data is not self._last_repo_data:
+            self._format_cache = {}
+            self._last_repo_data = repo_data
+        
+        keys = self._slice_for(section_title)
+        cached = self._format_cache.get(keys)
+        if cached is not None:
+            return cached
+        
+        relevant_data = {key: repo_data.get(key, _PROMPT_DATA_DEFAULTS[key]) for key in keys}
+        formatted = _json_text(relevant_data)
+        self._format_cache[keys] = formatted
+        return formatted
+    
+    def _slice_for(self, section_title: str) -> Tuple[str, ...]:
+        """
+        Get the repository data keys relevant to a section.
         
-        return json.dumps(relevant_data, indent=2, default=str)
+        Args:
+            section_title: Current section being generated
+            
+        Returns:
+            Ordered tuple of repo_data keys to include in the prompt
+        """
+        # Sections without a dedicated slice get basic project info
+        return _PROMPT_DATA_SLICES.get(section_title, _DEFAULT_PROMPT_DATA_SLICE)
     
     def _load_meta_prompt(self) -> str:
         """
@@ -620,9 +748,11 @@ Complexity: {self._assess_complexity(repo_data)}
         """
         meta_prompt_path = self.prompts_dir / "meta_prompt.txt"
         
-        if meta_prompt_path.exists():
+        try:
             with open(meta_prompt_path, 'r', encoding='utf-8') as f:
                 return f.read()
+        except FileNotFoundError:
+            pass
         
         # Create default meta-prompt
         default_meta_prompt = """
@@ -639,8 +769,7 @@ Key principles:
 You have access to parsed repository data including code structure, dependencies, README content, and configuration files. Use this information to create accurate, helpful documentation.
 """
         
-        with open(meta_prompt_path, 'w', encoding='utf-8') as f:
-            f.write(default_meta_prompt)
+        self._write_if_missing(meta_prompt_path, default_meta_prompt)
         
         return default_meta_prompt
     
@@ -649,9 +778,7 @@ You have access to parsed repository data including code structure, dependencies
         Create prompt template files if they don't exist.
         """
         # Create outline prompt template
-        outline_prompt_path = self.prompts_dir / "outline_prompt.txt"
-        if not outline_prompt_path.exists():
-            outline_prompt = """
+        outline_prompt = """
 Generate a structured outline for project documentation based on the provided repository analysis.
 
 Consider:
@@ -662,13 +789,10 @@ Consider:
 
 Output a prioritized list of sections with descriptions.
 """
-            with open(outline_prompt_path, 'w', encoding='utf-8') as f:
-                f.write(outline_prompt)
+        self._write_if_missing(self.prompts_dir / "outline_prompt.txt", outline_prompt)
         
         # Create section prompt template
-        section_prompt_path = self.prompts_dir / "section_prompt.txt"
-        if not section_prompt_path.exists():
-            section_prompt = """
+        section_prompt = """
 Generate a specific documentation section based on the provided outline and repository data.
 
 Requirements:
@@ -678,8 +802,24 @@ Requirements:
 - Write in clear, professional markdown
 - Be comprehensive but concise
 """
-            with open(section_prompt_path, 'w', encoding='utf-8') as f:
-                f.write(section_prompt)
+        self._write_if_missing(self.prompts_dir / "section_prompt.txt", section_prompt)
+    
+    def _write_if_missing(self, path: Path, content: str):
+        """
+        Write a default prompt file unless it already exists.
+        
+        Exclusive creation makes the existence check and the write a single
+        atomic step, so concurrent planners never write the same file twice.
+        
+        Args:
+            path: Prompt file path
+            content: Default file content
+        """
+        try:
+            with open(path, 'x', encoding='utf-8') as f:
+                f.write(content)
+        except FileExistsError:
+            pass
     
     def _save_outline(self, outline: Dict[str, Any]):
         """
@@ -689,8 +829,8 @@ Requirements:
             outline: Generated outline data
         """
         outline_path = self.prompts_dir / "generated_outline.json"
-        with open(outline_path, 'w', encoding='utf-8') as f:
-            json.dump(outline, f, indent=2, default=str)
+        # Encode the whole payload up front and hand it to the OS in one write
+        outline_path.write_bytes(_json_bytes(outline))
         
         print(f"📄 Outline saved to {outline_path}")
 
@@ -708,8 +848,11 @@ if __name__ == "__main__":
         print(f"Repository data file does not exist: {repo_data_path}")
         sys.exit(1)
     
-    with open(repo_data_path, 'r', encoding='utf-8') as f:
-        repo_data = json.load(f)
+    # Read the dump in one call; orjson parses the bytes directly
+    if orjson is not None:
+        repo_data = orjson.loads(repo_data_path.read_bytes())
+    else:
+        repo_data = json.loads(repo_data_path.read_bytes())
     
     planner = DocPlanner()
     ai_context = {}  # Empty context for testing
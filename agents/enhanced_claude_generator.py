@@ -8,15 +8,450 @@ that can accurately replicate or build repositories with precise, executable ins
 
 import os
 import json
+import logging
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
+from functools import cached_property, wraps
+from itertools import count, islice
+from string import Template
+from types import MappingProxyType
 
 # Opik for LLM observability
 import opik
 from opik import track
 
+# pyahocorasick is optional; domain detection falls back to substring scans
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def _read_track_sample() -> int:
+    """Parse OPIK_SAMPLE, tracing every call when it is not an integer."""
+    value = os.environ.get('OPIK_SAMPLE', '1')
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning("⚠️ Ignoring invalid OPIK_SAMPLE=%r; tracing every call", value)
+        return 1
+
+
+# Trace one in every OPIK_SAMPLE prompt generations (1 traces every call)
+_TRACK_SAMPLE = _read_track_sample()
+
+
+def _sampled_track(name: str):
+    """
+    Opik ``track`` decorator that only traces one in ``_TRACK_SAMPLE`` calls.
+    
+    The traced wrapper is built once; untraced calls go straight to the
+    undecorated function and skip Opik's context capture entirely.
+    """
+    def decorator(fn):
+        traced = track(name=name)(fn)
+        if _TRACK_SAMPLE == 1:
+            return traced
+        
+        counter = count()
+        
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if next(counter) % _TRACK_SAMPLE == 0:
+                return traced(*args, **kwargs)
+            return fn(*args, **kwargs)
+        
+        return wrapper
+    return decorator
+
+
+# Shared read-only fallback for missing nested mappings
+_EMPTY = MappingProxyType({})
+
+# Maximum number of repositories whose analysis is kept per generator
+_ANALYSIS_CACHE_SIZE = 128
+
+# Leading indefinite article dropped when a purpose becomes a project name
+_ARTICLE_RE = re.compile(r'^an? ')
+
+# Characters of documentation scanned when extracting project context
+_DOC_SCAN_LIMIT = 16384
+
+# Directories recorded but never descended into when walking a repository
+_SKIP_WALK_DIRS = frozenset({'.git', 'node_modules', '__pycache__'})
+
+# Hosted demo URLs commonly linked from READMEs
+_DEMO_PATTERNS = tuple(re.compile(p) for p in [
+    r'https?://[^\s]+\.vercel\.app[^\s]*',
+    r'https?://[^\s]+\.netlify\.app[^\s]*',
+    r'https?://[^\s]+\.herokuapp\.com[^\s]*',
+    r'https?://[^\s]+\.github\.io[^\s]*',
+    r'https?://[^\s]+\.lovable\.app[^\s]*'
+])
+
+# Purpose indicators in documentation, tried in order
+_PURPOSE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'(?:is|provides|offers|enables|helps|allows|creates|builds)\s+([^.!?]+)',
+    r'(?:purpose|goal|objective|aim):\s*([^.!?]+)',
+    r'(?:description|summary):\s*([^.!?]+)',
+    r'(?:about|overview):\s*([^.!?]+)'
+])
+
+# Bulleted feature blocks under any of the feature headings, the bullet
+# lines inside them, and characters stripped from each feature
+_FEATURE_BLOCK_RE = re.compile(
+    r'(features?|capabilities?|functionality|includes?):\s*\n((?:\s*[-*]\s*[^\n]+\n?)+)',
+    re.IGNORECASE
+)
+_FEATURE_HEADING_ORDER = {
+    'feature': 0, 'features': 0,
+    'capability': 1, 'capabilities': 1,
+    'functionality': 2,
+    'include': 3, 'includes': 3
+}
+_FEATURE_LINE_RE = re.compile(r'[-*]\s*([^\n]+)')
+_FEATURE_STRIP_RE = re.compile(r'[^\w\s-]')
+
+# Application domains in priority order with their documentation keywords
+_DOMAIN_KEYWORDS = {
+    'e-commerce': ('shop', 'cart', 'payment', 'product', 'order'),
+    'social media': ('social', 'post', 'follow', 'like', 'share', 'comment'),
+    'productivity': ('task', 'todo', 'project', 'manage', 'organize'),
+    'finance': ('finance', 'money', 'bank', 'payment', 'transaction'),
+    'education': ('learn', 'course', 'student', 'teach', 'education'),
+    'healthcare': ('health', 'medical', 'patient', 'doctor', 'clinic'),
+    'entertainment': ('game', 'music', 'video', 'media', 'entertainment'),
+    'business': ('business', 'crm', 'enterprise', 'company', 'corporate')
+}
+
+
+def _build_domain_automaton():
+    """Build an Aho-Corasick automaton over all domain keywords."""
+    automaton = ahocorasick.Automaton()
+    for keywords in _DOMAIN_KEYWORDS.values():
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_DOMAIN_AUTOMATON = _build_domain_automaton() if ahocorasick is not None else None
+
+
+# Framework detection rules: root files, dependency names and path indicators
+_FRAMEWORK_PATTERNS = {
+    'react': {
+        'files': ('package.json',),
+        'dependencies': frozenset({'react', '@types/react', 'react-dom'}),
+        'indicators': ('jsx', 'tsx', 'components/', 'src/App.jsx', 'src/App.tsx')
+    },
+    'vue': {
+        'files': ('package.json',),
+        'dependencies': frozenset({'vue', '@vue/cli', 'nuxt'}),
+        'indicators': ('.vue', 'src/App.vue', 'components/')
+    },
+    'angular': {
+        'files': ('package.json', 'angular.json'),
+        'dependencies': frozenset({'@angular/core', '@angular/cli'}),
+        'indicators': ('src/app/', '.component.ts', '.service.ts')
+    },
+    'next': {
+        'files': ('package.json', 'next.config.js'),
+        'dependencies': frozenset({'next', 'react'}),
+        'indicators': ('pages/', 'app/', '_app.js', '_document.js')
+    },
+    'vite': {
+        'files': ('vite.config.js', 'vite.config.ts', 'package.json'),
+        'dependencies': frozenset({'vite', '@vitejs/plugin-react'}),
+        'indicators': ('index.html', 'src/main.jsx', 'src/main.tsx')
+    },
+    'express': {
+        'files': ('package.json',),
+        'dependencies': frozenset({'express', 'node'}),
+        'indicators': ('server.js', 'app.js', 'routes/', 'middleware/')
+    },
+    'fastapi': {
+        'files': ('requirements.txt', 'pyproject.toml'),
+        'dependencies': frozenset({'fastapi', 'uvicorn'}),
+        'indicators': ('main.py', 'app/', 'routers/')
+    },
+    'django': {
+        'files': ('requirements.txt', 'manage.py'),
+        'dependencies': frozenset({'django'}),
+        'indicators': ('settings.py', 'urls.py', 'models.py')
+    },
+    'flask': {
+        'files': ('requirements.txt',),
+        'dependencies': frozenset({'flask'}),
+        'indicators': ('app.py', 'run.py', 'templates/')
+    },
+    'supabase': {
+        'files': ('package.json',),
+        'dependencies': frozenset({'@supabase/supabase-js'}),
+        'indicators': ('supabase/', '.env.local')
+    },
+    'tailwind': {
+        'files': ('tailwind.config.js', 'tailwind.config.ts', 'package.json'),
+        'dependencies': frozenset({'tailwindcss', 'autoprefixer', 'postcss'}),
+        'indicators': ('src/index.css', 'styles/globals.css')
+    },
+    'shadcn': {
+        'files': ('components.json', 'package.json'),
+        'dependencies': frozenset({'@radix-ui/react-', 'lucide-react', 'class-variance-authority'}),
+        'indicators': ('components/ui/', 'lib/utils.ts')
+    }
+}
+
+# Frameworks that characterize each project type, in priority order
+_PROJECT_TYPES = {
+    'web_frontend': frozenset({'react', 'vue', 'angular', 'next', 'vite'}),
+    'web_backend': frozenset({'express', 'fastapi', 'django', 'flask'}),
+    'fullstack': frozenset({'next', 'nuxt', 'sveltekit'}),
+    'mobile': frozenset({'react-native', 'flutter', 'ionic'}),
+    'desktop': frozenset({'electron', 'tauri', 'flutter'}),
+    'library': frozenset({'typescript', 'javascript', 'python'}),
+    'cli_tool': frozenset({'node', 'python', 'go', 'rust'})
+}
+
+
+def _compile_framework_checker(name: str, config: Dict[str, Any]):
+    """
+    Generate a detection function specialized to one framework's rules.
+    
+    The rules are known at import time, so file names, dependency names and
+    indicator suffixes are inlined into a straight boolean chain instead of
+    being interpreted from the config dict on every check. The generated
+    function takes the repository's relative path set, the merged
+    package.json dependencies, their names joined by newlines and whether
+    node dependencies were parsed. Partial names are found with one C-level
+    substring search of the joined names; no name contains a newline, so a
+    hit never spans two dependencies.
+    """
+    if config['dependencies']:
+        dep_scan = ' or '.join(f"{dep!r} in dep_text" for dep in sorted(config['dependencies']))
+        deps_match = f"not DEPS.isdisjoint(package_deps) or {dep_scan}"
+    else:
+        deps_match = "False"
+    
+    lines = [f"def check_{name}(repo_paths, package_deps, dep_text, has_node):"]
+    for file_pattern in config['files']:
+        present = f"({f'/{file_pattern}'!r} in repo_paths or {f'/{file_pattern}/'!r} in repo_paths)"
+        if 'package.json' in file_pattern:
+            lines.append(f"    if {present} and (not has_node or {deps_match}):")
+        else:
+            lines.append(f"    if {present}:")
+        lines.append("        return True")
+    lines.append("    return any(path.endswith(SUFFIXES) for path in repo_paths)")
+    
+    suffixes = []
+    for indicator in config['indicators']:
+        suffixes.append(f"/{indicator}")
+        if not indicator.endswith('/'):
+            suffixes.append(f"/{indicator}/")
+    
+    namespace = {'DEPS': config['dependencies'], 'SUFFIXES': tuple(suffixes)}
+    exec(compile('\n'.join(lines), f"<framework:{name}>", 'exec'), namespace)
+    return namespace[f"check_{name}"]
+
+
+# Specialized detection functions, one per framework
+_FRAMEWORK_CHECKERS = {
+    name: _compile_framework_checker(name, config)
+    for name, config in _FRAMEWORK_PATTERNS.items()
+}
+
+
+# Claude Desktop prompt document; placeholders are filled once per repository
+_PROJECT_PROMPTS_TEXT = """# Claude Desktop Prompts for Building $project_name
+
+These prompts will help you **build and implement** the **$project_name** project from scratch using Claude Desktop, based on comprehensive analysis of the repository.
+
+## Project Information
+
+- **GitHub URL:** $github_url
+- **Primary Language:** $primary_language
+- **Project Type:** $project_type
+- **File Count:** $file_count
+- **Live Demo:** $demo_url
+- **Complexity:** $complexity
+- **Reference Documentation:** $base_filename
+
+## Project Overview
+
+**$project_name** is $purpose.
+
+### Core Features
+$features_list
+
+### Technology Stack
+$tech_stack
+
+### Architecture Overview
+$architecture
+
+---
+
+## Prompt 1: Project Setup & Environment Configuration
+
+```
+You are a senior full-stack developer and $primary_framework specialist. I need you to help me build $project_name, $purpose.
+
+**Project Context:**
+- Primary Language: $primary_language
+- Framework: $primary_framework
+- Reference Repository: $github_url
+- Target Complexity: $complexity ($file_count files)
+- Core Purpose: $purpose
+
+**Technology Stack:**
+$tech_stack_for_prompt
+
+**Your Role:**
+- Expert $primary_language/$primary_framework developer with 10+ years experience
+- $domain application specialist
+- Modern web development and tooling expert
+- Code quality and best practices advocate
+
+**Task:**
+Help me set up the foundational architecture for $project_name:
+
+$setup_instructions
+
+**Output Requirements:**
+- Fully configured $primary_framework project
+- All necessary dependencies installed
+- Proper project structure for $domain application
+- Development environment ready for implementation
+- Working build and development scripts
+
+**Quality Standards:**
+$quality_standards
+
+Please provide the complete project setup with all configuration files and explain each step clearly.
+```
+
+---
+
+## Prompt 2: Core Implementation & Feature Development
+
+```
+You are an expert $primary_framework developer and $domain application architect. Building on the project setup from the previous step, I need you to implement the core functionality.
+
+**Previous Setup Context:**
+[PASTE THE OUTPUT FROM PROMPT 1 HERE]
+
+**Project Details:**
+- Repository Reference: $github_url
+- Technology Stack: $tech_stack_simple
+- Target: Build $purpose
+- Core Features: $core_features
+
+**Your Enhanced Role:**
+- Senior $primary_language/$primary_framework developer
+- $domain domain expert
+- API design and integration specialist
+- Performance optimization expert
+
+**Implementation Tasks:**
+
+$implementation_tasks
+
+**Code Quality Requirements:**
+$code_quality_requirements
+
+**Deliverables:**
+- Complete, functional codebase
+- Working application with core features
+- Comprehensive component structure
+- Proper state management implementation
+- Clear code documentation
+
+**Implementation Checklist:**
+$implementation_checklist
+
+Please provide complete, working code implementations that I can use to build $project_name with these key features.
+```
+
+---
+
+## Prompt 3: Advanced Features & Production Optimization
+
+```
+You are a senior software architect and production systems specialist. I need you to implement advanced features and optimize my $project_name for production deployment.
+
+**Complete Implementation Context:**
+[PASTE ALL PREVIOUS OUTPUTS HERE]
+
+**Project Status:**
+- Repository Reference: $github_url
+- Technology: $primary_language with $primary_framework
+- Current State: Functional $project_name with core features
+- Target: Production-ready application with advanced features
+
+**Your Expert Role:**
+- Senior software architect
+- Performance optimization specialist
+- Security and compliance expert
+- DevOps and deployment specialist
+
+**Advanced Implementation Tasks:**
+
+$advanced_tasks
+
+**Production Optimization:**
+$production_optimization
+
+**Final Deliverables:**
+- Production-optimized application
+- Advanced feature implementations
+- Security hardening
+- Performance monitoring
+- Deployment configuration
+
+**Production Checklist:**
+$production_checklist
+
+Please provide a complete production-ready implementation with all advanced features and optimizations.
+```
+
+---
+
+## Implementation Guide
+
+### Development Workflow:
+1. **Sequential Development**: Follow prompts in order (Setup → Core → Advanced)
+2. **Context Preservation**: Always include previous outputs in subsequent prompts
+3. **Iterative Testing**: Test each component before proceeding
+4. **Quality Validation**: Ensure code quality at each step
+
+### Expected Outcomes:
+- **Functional Application**: Complete, working $project_name
+- **Modern Architecture**: Built with $primary_framework best practices
+- **Production Ready**: Optimized for real-world deployment
+- **Comprehensive Features**: $highlight_features
+
+### Success Criteria:
+- ✅ Project builds and runs without errors
+- ✅ All core features are implemented and working
+- ✅ Code follows $primary_framework best practices
+- ✅ Application is responsive and performant
+- ✅ Production deployment is successful
+
+---
+
+*Generated by Enhanced PromptSwitch for $project_name - $generated_at*
+"""
+
+# The document split after each '---' rule so sections render one at a time
+_PROJECT_PROMPTS_SECTIONS = tuple(
+    Template(section) for section in re.split(r'(?<=\n---\n)', _PROJECT_PROMPTS_TEXT)
+)
+
 
 class EnhancedClaudeGenerator:
     """
@@ -25,80 +460,31 @@ class EnhancedClaudeGenerator:
     """
     
     def __init__(self):
-        self.framework_patterns = {
-            'react': {
-                'files': ['package.json'],
-                'dependencies': ['react', '@types/react', 'react-dom'],
-                'indicators': ['jsx', 'tsx', 'components/', 'src/App.jsx', 'src/App.tsx']
-            },
-            'vue': {
-                'files': ['package.json'],
-                'dependencies': ['vue', '@vue/cli', 'nuxt'],
-                'indicators': ['.vue', 'src/App.vue', 'components/']
-            },
-            'angular': {
-                'files': ['package.json', 'angular.json'],
-                'dependencies': ['@angular/core', '@angular/cli'],
-                'indicators': ['src/app/', '.component.ts', '.service.ts']
-            },
-            'next': {
-                'files': ['package.json', 'next.config.js'],
-                'dependencies': ['next', 'react'],
-                'indicators': ['pages/', 'app/', '_app.js', '_document.js']
-            },
-            'vite': {
-                'files': ['vite.config.js', 'vite.config.ts', 'package.json'],
-                'dependencies': ['vite', '@vitejs/plugin-react'],
-                'indicators': ['index.html', 'src/main.jsx', 'src/main.tsx']
-            },
-            'express': {
-                'files': ['package.json'],
-                'dependencies': ['express', 'node'],
-                'indicators': ['server.js', 'app.js', 'routes/', 'middleware/']
-            },
-            'fastapi': {
-                'files': ['requirements.txt', 'pyproject.toml'],
-                'dependencies': ['fastapi', 'uvicorn'],
-                'indicators': ['main.py', 'app/', 'routers/']
-            },
-            'django': {
-                'files': ['requirements.txt', 'manage.py'],
-                'dependencies': ['django'],
-                'indicators': ['settings.py', 'urls.py', 'models.py']
-            },
-            'flask': {
-                'files': ['requirements.txt'],
-                'dependencies': ['flask'],
-                'indicators': ['app.py', 'run.py', 'templates/']
-            },
-            'supabase': {
-                'files': ['package.json'],
-                'dependencies': ['@supabase/supabase-js'],
-                'indicators': ['supabase/', '.env.local']
-            },
-            'tailwind': {
-                'files': ['tailwind.config.js', 'tailwind.config.ts', 'package.json'],
-                'dependencies': ['tailwindcss', 'autoprefixer', 'postcss'],
-                'indicators': ['src/index.css', 'styles/globals.css']
-            },
-            'shadcn': {
-                'files': ['components.json', 'package.json'],
-                'dependencies': ['@radix-ui/react-', 'lucide-react', 'class-variance-authority'],
-                'indicators': ['components/ui/', 'lib/utils.ts']
-            }
-        }
+        # (repo path, relative paths) from the last repository walk, reset per generation
+        self._repo_paths_cache = None
         
-        self.project_types = {
-            'web_frontend': ['react', 'vue', 'angular', 'next', 'vite'],
-            'web_backend': ['express', 'fastapi', 'django', 'flask'],
-            'fullstack': ['next', 'nuxt', 'sveltekit'],
-            'mobile': ['react-native', 'flutter', 'ionic'],
-            'desktop': ['electron', 'tauri', 'flutter'],
-            'library': ['typescript', 'javascript', 'python'],
-            'cli_tool': ['node', 'python', 'go', 'rust']
-        }
+        # Analysis results keyed by repo_data identity and a few cheap fields
+        self._analysis_cache = {}
     
-    @track(name="claude_prompt_generation")
+    @cached_property
+    def framework_patterns(self) -> Dict[str, Dict[str, Any]]:
+        """Framework detection patterns; override to add or replace frameworks."""
+        return _FRAMEWORK_PATTERNS
+    
+    @cached_property
+    def framework_checkers(self) -> Dict[str, Any]:
+        """Compiled detection function for each entry in framework_patterns."""
+        if self.framework_patterns is _FRAMEWORK_PATTERNS:
+            return _FRAMEWORK_CHECKERS
+        return {name: _compile_framework_checker(name, config)
+                for name, config in self.framework_patterns.items()}
+    
+    @cached_property
+    def project_types(self) -> Dict[str, frozenset]:
+        """Framework sets that classify a project; override to customize."""
+        return _PROJECT_TYPES
+    
+    @_sampled_track(name="claude_prompt_generation")
     def generate_enhanced_prompts(self, github_url: str, repo_data: Dict[str, Any], 
                                 documentation: str, base_filename: str) -> str:
         """
@@ -113,11 +499,12 @@ class EnhancedClaudeGenerator:
         Returns:
             Formatted Claude Desktop prompts
         """
+        # Walk the repository afresh; its files may have changed since the last call
+        self._repo_paths_cache = None
+        
         # Deep analysis of the project
-        tech_stack = self._analyze_technology_stack(repo_data)
-        project_context = self._extract_project_context(documentation, repo_data)
-        setup_requirements = self._analyze_setup_requirements(repo_data, tech_stack)
-        architecture_info = self._analyze_architecture(repo_data, documentation)
+        tech_stack, project_context, setup_requirements, architecture_info = \
+            self._analyze_all(github_url, repo_data, documentation)
         
         # Generate project-specific prompts
         prompts_content = self._generate_project_prompts(
@@ -132,6 +519,39 @@ class EnhancedClaudeGenerator:
         
         return prompts_content
     
+    def _analyze_all(self, github_url: str, repo_data: Dict[str, Any],
+                     documentation: str) -> Tuple[Dict[str, Any], ...]:
+        """
+        Run the project analyses, reusing results for unchanged inputs.
+        
+        Prompts are often regenerated for the same repository while tuning,
+        so results are cached per repo_data object, as doc_planner's
+        dependency index is. The key adds the URL, documentation and a few
+        cheap repo_data fields instead of serializing the whole dict, so a
+        hit costs a tuple hash. A freshly parsed repo_data is a new object
+        and always misses.
+        """
+        statistics = repo_data.get('statistics') or _EMPTY
+        cache_key = (id(repo_data), github_url, documentation, repo_data.get('path'),
+                     statistics.get('total_files'), statistics.get('total_lines'))
+        
+        # The entry keeps repo_data alive, so its id cannot be reused while cached
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None and cached[0] is repo_data:
+            return cached[1]
+        
+        tech_stack = self._analyze_technology_stack(repo_data)
+        project_context = self._extract_project_context(documentation, repo_data)
+        setup_requirements = self._analyze_setup_requirements(repo_data, tech_stack)
+        architecture_info = self._analyze_architecture(repo_data, documentation)
+        analysis = (tech_stack, project_context, setup_requirements, architecture_info)
+        
+        # Evict the oldest entry once the cache is full
+        if len(self._analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+            del self._analysis_cache[next(iter(self._analysis_cache))]
+        self._analysis_cache[cache_key] = (repo_data, analysis)
+        return analysis
+    
     def _analyze_technology_stack(self, repo_data: Dict[str, Any]) -> Dict[str, Any]:
         """Perform deep analysis of the technology stack."""
         tech_stack = {
@@ -147,12 +567,22 @@ class EnhancedClaudeGenerator:
         }
         
         # Analyze dependencies for frameworks and libraries
-        dependencies = repo_data.get('dependencies', {})
+        dependencies = repo_data.get('dependencies', _EMPTY)
         repo_path = Path(repo_data.get('path', ''))
         
+        # Walk the repository once and match every framework against it
+        repo_paths = self._collect_repo_paths(repo_path)
+        
+        # Merge package.json dependencies once for all framework checks
+        has_node = 'node' in dependencies
+        package_json = dependencies['node'].get('package.json', _EMPTY) if has_node else _EMPTY
+        package_deps = {**package_json.get('dependencies', _EMPTY),
+                        **package_json.get('devDependencies', _EMPTY)}
+        dep_text = '\n'.join(package_deps)
+        
         # Check for frameworks
-        for framework, config in self.framework_patterns.items():
-            if self._detect_framework(repo_path, dependencies, config):
+        for framework, checker in self.framework_checkers.items():
+            if checker(repo_paths, package_deps, dep_text, has_node):
                 if framework in ['react', 'vue', 'angular', 'next', 'vite']:
                     tech_stack['frameworks'].append(framework)
                 elif framework in ['tailwind', 'shadcn']:
@@ -161,11 +591,9 @@ class EnhancedClaudeGenerator:
                     tech_stack['databases'].append(framework)
         
         # Analyze package.json for additional insights
-        if 'node' in dependencies:
-            package_json = dependencies['node'].get('package.json', {})
-            if package_json:
-                tech_stack['libraries'].extend(self._extract_key_libraries(package_json))
-                tech_stack['tools'].extend(self._extract_dev_tools(package_json))
+        if package_json:
+            tech_stack['libraries'].extend(self._extract_key_libraries(package_json))
+            tech_stack['tools'].extend(self._extract_dev_tools(package_json))
         
         # Analyze Python requirements
         if 'python' in dependencies:
@@ -174,29 +602,44 @@ class EnhancedClaudeGenerator:
         
         return tech_stack
     
-    def _detect_framework(self, repo_path: Path, dependencies: Dict, config: Dict) -> bool:
-        """Detect if a specific framework is used in the project."""
-        # Check for required files
-        for file_pattern in config.get('files', []):
-            if list(repo_path.glob(file_pattern)):
-                # Check dependencies if package.json exists
-                if 'package.json' in file_pattern and 'node' in dependencies:
-                    package_data = dependencies['node'].get('package.json', {})
-                    deps = {**package_data.get('dependencies', {}), 
-                           **package_data.get('devDependencies', {})}
-                    
-                    for dep in config.get('dependencies', []):
-                        if any(dep in key for key in deps.keys()):
-                            return True
-                else:
-                    return True
-        
-        # Check for indicator files/directories
-        for indicator in config.get('indicators', []):
-            if list(repo_path.glob(f"**/{indicator}")):
-                return True
-        
-        return False
+    def _collect_repo_paths(self, repo_path: Path) -> set:
+        """
+        Walk the repository once and collect its relative paths.
+        
+        Paths are stored with a leading '/' and directories with a trailing
+        '/', so a recursive ``**/name`` glob becomes a suffix check.
+        ``os.scandir`` entries carry their type from the directory listing,
+        so no per-entry stat is needed. VCS metadata, installed node modules
+        and bytecode caches are listed but not descended into.
+        The result is reused within one generate_enhanced_prompts call.
+        """
+        cache_key = str(repo_path)
+        if self._repo_paths_cache is not None and self._repo_paths_cache[0] == cache_key:
+            return self._repo_paths_cache[1]
+        
+        repo_paths = set()
+        stack = [(cache_key, '/')]
+        while stack:
+            dirpath, prefix = stack.pop()
+            try:
+                with os.scandir(dirpath) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            rel_path = f"{prefix}{entry.name}/"
+                            repo_paths.add(rel_path)
+                            if entry.name not in _SKIP_WALK_DIRS and not entry.is_symlink():
+                                stack.append((entry.path, rel_path))
+                        else:
+                            repo_paths.add(f"{prefix}{entry.name}")
+            except OSError:
+                continue
+        
+        self._repo_paths_cache = (cache_key, repo_paths)
+        return repo_paths
     
     def _extract_project_context(self, documentation: str, repo_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract comprehensive project context from documentation and repo data."""
@@ -210,14 +653,19 @@ class EnhancedClaudeGenerator:
             'business_logic': []
         }
         
+        # Feature and domain signals live near the top of the docs, so scan a
+        # bounded prefix and lowercase it once for all keyword checks
+        doc_head = documentation[:_DOC_SCAN_LIMIT]
+        doc_lower = doc_head.lower()
+        
         # Extract purpose from documentation
-        context['purpose'] = self._extract_purpose_advanced(documentation)
+        context['purpose'] = self._extract_purpose_advanced(doc_head, doc_lower)
         
         # Extract features with better analysis
-        context['features'] = self._extract_features_advanced(documentation, repo_data)
+        context['features'] = self._extract_features_advanced(doc_head, repo_data, doc_lower)
         
         # Determine domain
-        context['domain'] = self._determine_domain(documentation, repo_data)
+        context['domain'] = self._determine_domain(doc_head, repo_data, doc_lower)
         
         # Assess complexity
         context['complexity'] = self._assess_complexity_advanced(repo_data, documentation)
@@ -271,208 +719,83 @@ class EnhancedClaudeGenerator:
                                 setup_requirements: Dict[str, Any], architecture_info: Dict[str, Any],
                                 base_filename: str) -> str:
         """Generate comprehensive, executable Claude Desktop prompts."""
+        return ''.join(self._iter_project_prompts(
+            github_url=github_url,
+            repo_data=repo_data,
+            tech_stack=tech_stack,
+            project_context=project_context,
+            setup_requirements=setup_requirements,
+            architecture_info=architecture_info,
+            base_filename=base_filename
+        ))
+    
+    def _iter_project_prompts(self, github_url: str, repo_data: Dict[str, Any],
+                              tech_stack: Dict[str, Any], project_context: Dict[str, Any],
+                              setup_requirements: Dict[str, Any], architecture_info: Dict[str, Any],
+                              base_filename: str) -> Iterator[str]:
+        """Yield the Claude Desktop prompt document one section at a time."""
         
         repo_name = self._extract_repo_name(github_url)
-        project_name = project_context.get('purpose', repo_name).replace('a ', '').replace('an ', '')
+        project_name = _ARTICLE_RE.sub('', project_context.get('purpose', repo_name), count=1)
         
         # Determine the primary framework for specialized prompts
         primary_framework = self._get_primary_framework(tech_stack)
         
-        prompts_content = f"""# Claude Desktop Prompts for Building {project_name}
-
-These prompts will help you **build and implement** the **{project_name}** project from scratch using Claude Desktop, based on comprehensive analysis of the repository.
-
-## Project Information
-
-- **GitHub URL:** {github_url}
-- **Primary Language:** {tech_stack['primary_language']}
-- **Project Type:** {self._determine_project_type(tech_stack)}
-- **File Count:** {len(repo_data.get('files', []))}
-- **Live Demo:** {self._extract_demo_url(repo_data)}
-- **Complexity:** {project_context['complexity'].title()}
-- **Reference Documentation:** {base_filename}
-
-## Project Overview
-
-**{project_name}** is {project_context['purpose']}.
-
-### Core Features
-{self._format_features_list(project_context['features'])}
-
-### Technology Stack
-{self._format_tech_stack(tech_stack)}
-
-### Architecture Overview
-{self._format_architecture(architecture_info)}
-
----
-
-## Prompt 1: Project Setup & Environment Configuration
-
-```
-You are a senior full-stack developer and {primary_framework} specialist. I need you to help me build {project_name}, {project_context['purpose']}.
-
-**Project Context:**
-- Primary Language: {tech_stack['primary_language']}
-- Framework: {primary_framework}
-- Reference Repository: {github_url}
-- Target Complexity: {project_context['complexity'].title()} ({len(repo_data.get('files', []))} files)
-- Core Purpose: {project_context['purpose']}
-
-**Technology Stack:**
-{self._format_tech_stack_for_prompt(tech_stack)}
-
-**Your Role:**
-- Expert {tech_stack['primary_language']}/{primary_framework} developer with 10+ years experience
-- {project_context['domain']} application specialist
-- Modern web development and tooling expert
-- Code quality and best practices advocate
-
-**Task:**
-Help me set up the foundational architecture for {project_name}:
-
-{self._generate_setup_instructions(tech_stack, setup_requirements)}
-
-**Output Requirements:**
-- Fully configured {primary_framework} project
-- All necessary dependencies installed
-- Proper project structure for {project_context['domain']} application
-- Development environment ready for implementation
-- Working build and development scripts
-
-**Quality Standards:**
-{self._generate_quality_standards(tech_stack, primary_framework)}
-
-Please provide the complete project setup with all configuration files and explain each step clearly.
-```
-
----
-
-## Prompt 2: Core Implementation & Feature Development
-
-```
-You are an expert {primary_framework} developer and {project_context['domain']} application architect. Building on the project setup from the previous step, I need you to implement the core functionality.
-
-**Previous Setup Context:**
-[PASTE THE OUTPUT FROM PROMPT 1 HERE]
-
-**Project Details:**
-- Repository Reference: {github_url}
-- Technology Stack: {self._format_tech_stack_simple(tech_stack)}
-- Target: Build {project_context['purpose']}
-- Core Features: {', '.join(project_context['features'][:5])}
-
-**Your Enhanced Role:**
-- Senior {tech_stack['primary_language']}/{primary_framework} developer
-- {project_context['domain']} domain expert
-- API design and integration specialist
-- Performance optimization expert
-
-**Implementation Tasks:**
-
-{self._generate_implementation_tasks(project_context, tech_stack)}
-
-**Code Quality Requirements:**
-{self._generate_code_quality_requirements(tech_stack)}
-
-**Deliverables:**
-- Complete, functional codebase
-- Working application with core features
-- Comprehensive component structure
-- Proper state management implementation
-- Clear code documentation
-
-**Implementation Checklist:**
-{self._generate_implementation_checklist(project_context['features'])}
-
-Please provide complete, working code implementations that I can use to build {project_name} with these key features.
-```
-
----
-
-## Prompt 3: Advanced Features & Production Optimization
-
-```
-You are a senior software architect and production systems specialist. I need you to implement advanced features and optimize my {project_name} for production deployment.
-
-**Complete Implementation Context:**
-[PASTE ALL PREVIOUS OUTPUTS HERE]
-
-**Project Status:**
-- Repository Reference: {github_url}
-- Technology: {tech_stack['primary_language']} with {primary_framework}
-- Current State: Functional {project_name} with core features
-- Target: Production-ready application with advanced features
-
-**Your Expert Role:**
-- Senior software architect
-- Performance optimization specialist
-- Security and compliance expert
-- DevOps and deployment specialist
-
-**Advanced Implementation Tasks:**
-
-{self._generate_advanced_tasks(project_context, tech_stack)}
-
-**Production Optimization:**
-{self._generate_production_optimization(tech_stack)}
-
-**Final Deliverables:**
-- Production-optimized application
-- Advanced feature implementations
-- Security hardening
-- Performance monitoring
-- Deployment configuration
-
-**Production Checklist:**
-{self._generate_production_checklist(tech_stack)}
-
-Please provide a complete production-ready implementation with all advanced features and optimizations.
-```
-
----
-
-## Implementation Guide
-
-### Development Workflow:
-1. **Sequential Development**: Follow prompts in order (Setup → Core → Advanced)
-2. **Context Preservation**: Always include previous outputs in subsequent prompts
-3. **Iterative Testing**: Test each component before proceeding
-4. **Quality Validation**: Ensure code quality at each step
-
-### Expected Outcomes:
-- **Functional Application**: Complete, working {project_name}
-- **Modern Architecture**: Built with {primary_framework} best practices
-- **Production Ready**: Optimized for real-world deployment
-- **Comprehensive Features**: {', '.join(project_context['features'][:3])}
-
-### Success Criteria:
-- ✅ Project builds and runs without errors
-- ✅ All core features are implemented and working
-- ✅ Code follows {primary_framework} best practices
-- ✅ Application is responsive and performant
-- ✅ Production deployment is successful
-
----
-
-*Generated by Enhanced PromptSwitch for {project_name} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
-"""
+        # Compute every substitution exactly once, then fill each section
+        features = project_context['features']
+        substitutions = dict(
+            project_name=project_name,
+            github_url=github_url,
+            base_filename=base_filename,
+            primary_language=tech_stack['primary_language'],
+            primary_framework=primary_framework,
+            project_type=self._determine_project_type(tech_stack),
+            file_count=len(repo_data.get('files', [])),
+            demo_url=self._extract_demo_url(repo_data),
+            complexity=project_context['complexity'].title(),
+            purpose=project_context['purpose'],
+            domain=project_context['domain'],
+            features_list=self._format_features_list(features),
+            tech_stack=self._format_tech_stack(tech_stack),
+            architecture=self._format_architecture(architecture_info),
+            tech_stack_for_prompt=self._format_tech_stack_for_prompt(tech_stack),
+            setup_instructions=self._generate_setup_instructions(tech_stack, setup_requirements),
+            quality_standards=self._generate_quality_standards(tech_stack, primary_framework),
+            tech_stack_simple=self._format_tech_stack_simple(tech_stack),
+            core_features=', '.join(islice(features, 5)),
+            implementation_tasks=self._generate_implementation_tasks(project_context, tech_stack),
+            code_quality_requirements=self._generate_code_quality_requirements(tech_stack),
+            implementation_checklist=self._generate_implementation_checklist(features),
+            advanced_tasks=self._generate_advanced_tasks(project_context, tech_stack),
+            production_optimization=self._generate_production_optimization(tech_stack),
+            production_checklist=self._generate_production_checklist(tech_stack),
+            highlight_features=', '.join(islice(features, 3)),
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
         
-        return prompts_content
+        for section in _PROJECT_PROMPTS_SECTIONS:
+            yield section.substitute(substitutions)
     
     # Helper methods for prompt generation
     def _extract_repo_name(self, github_url: str) -> str:
         """Extract clean repository name from GitHub URL."""
-        return github_url.split('/')[-1].replace('.git', '')
+        repo_name = github_url.rsplit('/', 1)[-1]
+        return repo_name[:-4] if repo_name.endswith('.git') else repo_name
     
     def _get_primary_language(self, repo_data: Dict[str, Any]) -> str:
         """Get the primary programming language."""
         languages = repo_data.get('languages', {})
         if isinstance(languages, dict) and languages:
-            return max(languages.items(), key=lambda x: x[1])[0]
+            return max(languages, key=languages.__getitem__)
         return 'Unknown'
     
     def _get_primary_framework(self, tech_stack: Dict[str, Any]) -> str:
+        """Determine the primary framework, memoized on the tech stack."""
+        if '_primary_framework' not in tech_stack:
+            tech_stack['_primary_framework'] = self._detect_primary_framework(tech_stack)
+        return tech_stack['_primary_framework']
+    
+    def _detect_primary_framework(self, tech_stack: Dict[str, Any]) -> str:
         """Determine the primary framework."""
         frameworks = tech_stack.get('frameworks', [])
         if frameworks:
@@ -487,11 +810,17 @@ Please provide a complete production-ready implementation with all advanced feat
         return tech_stack.get('primary_language', 'Unknown').title()
     
     def _determine_project_type(self, tech_stack: Dict[str, Any]) -> str:
+        """Determine the project type, memoized on the tech stack."""
+        if '_project_type' not in tech_stack:
+            tech_stack['_project_type'] = self._classify_project_type(tech_stack)
+        return tech_stack['_project_type']
+    
+    def _classify_project_type(self, tech_stack: Dict[str, Any]) -> str:
         """Determine the project type based on technology stack."""
         frameworks = tech_stack.get('frameworks', [])
         
         for proj_type, type_frameworks in self.project_types.items():
-            if any(fw in frameworks for fw in type_frameworks):
+            if not type_frameworks.isdisjoint(frameworks):
                 return proj_type.replace('_', ' ').title()
         
         primary_lang = tech_stack.get('primary_language', '').lower()
@@ -504,20 +833,12 @@ Please provide a complete production-ready implementation with all advanced feat
     
     def _extract_demo_url(self, repo_data: Dict[str, Any]) -> str:
         """Extract demo URL from repository data."""
-        readme = repo_data.get('readme', {})
+        readme = repo_data.get('readme', _EMPTY)
         content = readme.get('content', '')
         
         # Look for common demo URL patterns
-        demo_patterns = [
-            r'https?://[^\s]+\.vercel\.app[^\s]*',
-            r'https?://[^\s]+\.netlify\.app[^\s]*',
-            r'https?://[^\s]+\.herokuapp\.com[^\s]*',
-            r'https?://[^\s]+\.github\.io[^\s]*',
-            r'https?://[^\s]+\.lovable\.app[^\s]*'
-        ]
-        
-        for pattern in demo_patterns:
-            match = re.search(pattern, content)
+        for pattern in _DEMO_PATTERNS:
+            match = pattern.search(content)
             if match:
                 return match.group(0).rstrip(')')
         
@@ -530,7 +851,7 @@ Please provide a complete production-ready implementation with all advanced feat
         """Format features as a bulleted list."""
         if not features:
             return "- Core application functionality"
-        return '\n'.join(f"- **{feature}**" for feature in features[:8])
+        return '\n'.join(f"- **{feature}**" for feature in islice(features, 8))
     
     def _format_tech_stack(self, tech_stack: Dict[str, Any]) -> str:
         """Format technology stack for display."""
@@ -542,7 +863,7 @@ Please provide a complete production-ready implementation with all advanced feat
         if tech_stack.get('databases'):
             lines.append(f"- **Backend:** {', '.join(tech_stack['databases'])}")
         if tech_stack.get('tools'):
-            lines.append(f"- **Tools:** {', '.join(tech_stack['tools'][:3])}")
+            lines.append(f"- **Tools:** {', '.join(islice(tech_stack['tools'], 3))}")
         
         return '\n'.join(lines) if lines else f"- **Primary:** {tech_stack.get('primary_language', 'Unknown')}"
     
@@ -559,18 +880,16 @@ Please provide a complete production-ready implementation with all advanced feat
         """Extract Python libraries from dependencies."""
         return []
     
-    def _extract_purpose_advanced(self, documentation: str) -> str:
+    def _extract_purpose_advanced(self, documentation: str, doc_lower: Optional[str] = None) -> str:
         """Extract project purpose with advanced analysis."""
+        # Patterns ignore case and the purpose is lowercased, so either form works
+        if doc_lower is None:
+            doc_lower = documentation.lower()
+        
         # Look for purpose indicators in documentation
-        purpose_patterns = [
-            r'(?i)(?:is|provides|offers|enables|helps|allows|creates|builds)\s+([^.!?]+)',
-            r'(?i)(?:purpose|goal|objective|aim):\s*([^.!?]+)',
-            r'(?i)(?:description|summary):\s*([^.!?]+)',
-            r'(?i)(?:about|overview):\s*([^.!?]+)'
-        ]
-        
-        for pattern in purpose_patterns:
-            match = re.search(pattern, documentation[:2000])
+        head = doc_lower[:2000]
+        for pattern in _PURPOSE_PATTERNS:
+            match = pattern.search(head)
             if match:
                 purpose = match.group(1).strip()
                 if len(purpose) > 10 and len(purpose) < 200:
@@ -579,65 +898,65 @@ Please provide a complete production-ready implementation with all advanced feat
         # Fallback to generic purpose
         return "a modern web application"
     
-    def _extract_features_advanced(self, documentation: str, repo_data: Dict) -> List[str]:
+    def _extract_features_advanced(self, documentation: str, repo_data: Dict,
+                                   doc_lower: Optional[str] = None) -> List[str]:
         """Extract features with advanced analysis."""
-        features = set()
-        
-        # Common feature patterns
-        feature_patterns = [
-            r'(?i)features?:\s*\n((?:\s*[-*]\s*[^\n]+\n?)+)',
-            r'(?i)capabilities?:\s*\n((?:\s*[-*]\s*[^\n]+\n?)+)',
-            r'(?i)functionality:\s*\n((?:\s*[-*]\s*[^\n]+\n?)+)',
-            r'(?i)includes?:\s*\n((?:\s*[-*]\s*[^\n]+\n?)+)'
-        ]
-        
-        for pattern in feature_patterns:
-            match = re.search(pattern, documentation)
-            if match:
-                feature_text = match.group(1)
-                # Extract individual features
-                feature_lines = re.findall(r'[-*]\s*([^\n]+)', feature_text)
-                for feature in feature_lines[:8]:  # Limit to 8 features
-                    clean_feature = re.sub(r'[^\w\s-]', '', feature.strip())
-                    if len(clean_feature) > 5:
-                        features.add(clean_feature)
+        if doc_lower is None:
+            doc_lower = documentation.lower()
+        
+        # Insertion-ordered dedup keeps the output stable across runs
+        features = {}
+        
+        # Common feature patterns: keep the first block under each heading kind
+        blocks = {}
+        for match in _FEATURE_BLOCK_RE.finditer(documentation):
+            blocks.setdefault(_FEATURE_HEADING_ORDER[match.group(1).lower()], match.group(2))
+            if len(blocks) == 4:
+                break
+        
+        for _, feature_text in sorted(blocks.items()):
+            # Extract individual features
+            for feature in _FEATURE_LINE_RE.findall(feature_text)[:8]:  # Limit to 8 features
+                clean_feature = _FEATURE_STRIP_RE.sub('', feature.strip())
+                if len(clean_feature) > 5:
+                    features[clean_feature] = None
         
         # Look for technology-specific features
-        if 'react' in documentation.lower():
-            features.update(['Component-based architecture', 'State management', 'Responsive UI'])
-        if 'api' in documentation.lower():
-            features.add('API integration')
-        if 'database' in documentation.lower() or 'supabase' in documentation.lower():
-            features.add('Data persistence')
-        if 'auth' in documentation.lower():
-            features.add('User authentication')
+        if 'react' in doc_lower:
+            features.update(dict.fromkeys(['Component-based architecture', 'State management', 'Responsive UI']))
+        if 'api' in doc_lower:
+            features['API integration'] = None
+        if 'database' in doc_lower or 'supabase' in doc_lower:
+            features['Data persistence'] = None
+        if 'auth' in doc_lower:
+            features['User authentication'] = None
         
         # Analyze file structure for features
         files = repo_data.get('files', [])
         if any('component' in f.lower() for f in files):
-            features.add('Component library')
+            features['Component library'] = None
         if any('test' in f.lower() for f in files):
-            features.add('Testing framework')
+            features['Testing framework'] = None
         if any('config' in f.lower() for f in files):
-            features.add('Configuration management')
+            features['Configuration management'] = None
         
         return list(features)[:8] if features else ['User interface', 'Data management', 'API integration']
     
-    def _determine_domain(self, documentation: str, repo_data: Dict) -> str:
+    def _determine_domain(self, documentation: str, repo_data: Dict,
+                          doc_lower: Optional[str] = None) -> str:
         """Determine application domain."""
-        domain_keywords = {
-            'e-commerce': ['shop', 'cart', 'payment', 'product', 'order'],
-            'social media': ['social', 'post', 'follow', 'like', 'share', 'comment'],
-            'productivity': ['task', 'todo', 'project', 'manage', 'organize'],
-            'finance': ['finance', 'money', 'bank', 'payment', 'transaction'],
-            'education': ['learn', 'course', 'student', 'teach', 'education'],
-            'healthcare': ['health', 'medical', 'patient', 'doctor', 'clinic'],
-            'entertainment': ['game', 'music', 'video', 'media', 'entertainment'],
-            'business': ['business', 'crm', 'enterprise', 'company', 'corporate']
-        }
+        if doc_lower is None:
+            doc_lower = documentation.lower()
+        
+        # One automaton pass finds every keyword; domains keep their priority order
+        if _DOMAIN_AUTOMATON is not None:
+            found = {keyword for _, keyword in _DOMAIN_AUTOMATON.iter(doc_lower)}
+            for domain, keywords in _DOMAIN_KEYWORDS.items():
+                if not found.isdisjoint(keywords):
+                    return domain
+            return 'web development'
         
-        doc_lower = documentation.lower()
-        for domain, keywords in domain_keywords.items():
+        for domain, keywords in _DOMAIN_KEYWORDS.items():
             if any(keyword in doc_lower for keyword in keywords):
                 return domain
         
@@ -743,7 +1062,7 @@ Please provide a complete production-ready implementation with all advanced feat
     
     def _generate_implementation_checklist(self, features: List[str]) -> str:
         """Generate implementation checklist."""
-        return '\n'.join(f"- [ ] {feature} implementation" for feature in features[:5])
+        return '\n'.join(f"- [ ] {feature} implementation" for feature in islice(features, 5))
     
     def _generate_advanced_tasks(self, context: Dict, tech_stack: Dict) -> str:
         """Generate advanced implementation tasks."""
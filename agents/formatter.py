@@ -6,26 +6,222 @@ Formats the filled documentation sections into a clean, structured markdown file
 Optionally converts to PDF or HTML using pandoc.
 """
 
+import io
 import json
-import subprocess
+import os
+import re
+import shutil
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 
-# Import the Python PDF converter as fallback
-try:
-    from .pdf_converter import PythonPDFConverter
-except ImportError:
-    PythonPDFConverter = None
+# subprocess, socket, urllib, concurrent.futures and the Python PDF
+# converter are imported where they are used, so importing this module
+# for markdown output alone does not load them
+
+# Logical order of documentation sections; unknown titles sort last
+_SECTION_ORDER = (
+    'Project Overview',
+    'Features',
+    'Technology Stack',
+    'Installation',
+    'Configuration',
+    'Usage',
+    'API Documentation',
+    'Project Structure',
+    'Development',
+    'Testing',
+    'Deployment',
+    'Contributing',
+    'License'
+)
+_SECTION_ORDER_INDEX = {title: index for index, title in enumerate(_SECTION_ORDER)}
+
+# Sort rank of section priorities within the same position
+_PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+
+# TOC anchor slugs: spaces become hyphens and slashes are dropped
+_ANCHOR_TABLE = str.maketrans({' ': '-', '/': None})
+
+# Static documentation footer
+_FOOTER = "\n".join([
+    "---",
+    "",
+    "## 📄 Documentation Info",
+    "",
+    "*This documentation was generated automatically by **PromptSwitch**.*",
+    "",
+    "**Created by:** [Avikalp Karrahe](https://github.com/Avikalp-Karrahe)",
+    "",
+    "**Connect with me:**",
+    "- 🔗 [LinkedIn](https://www.linkedin.com/in/avikalp-karrahe/)",
+    "- 💼 [GitHub](https://github.com/Avikalp-Karrahe)",
+    "- 🚀 [PromptSwitch Repository](https://github.com/Avikalp-Karrahe/PromptSwitch)"
+])
+
+# Comment appended to sections filled from a fallback template
+_FALLBACK_MARKER = "<!-- Generated using fallback template -->\n\n"
+
+# Seconds to wait for a pandoc server to start and for each conversion
+_PANDOC_SERVER_STARTUP_TIMEOUT = 5
+_PANDOC_SERVER_TIMEOUT = 60
+
+# LaTeX engine options matching the Reference.pdf template
+_LATEX_PDF_ARGS = (
+    '--toc',
+    '--toc-depth=3',
+    '-V', 'geometry:margin=1in',
+    '-V', 'fontsize=11pt',
+    '-V', 'documentclass=article',
+    '-V', 'colorlinks=true',
+    '-V', 'linkcolor=blue',
+    '-V', 'urlcolor=blue',
+    '--number-sections',
+    '--standalone'
+)
+
+# Pandoc arguments per PDF engine, in order of preference
+_PDF_ENGINE_ARGS = {
+    'xelatex': ('--pdf-engine=xelatex',) + _LATEX_PDF_ARGS,
+    'pdflatex': ('--pdf-engine=pdflatex',) + _LATEX_PDF_ARGS,
+    'wkhtmltopdf': (
+        '--pdf-engine=wkhtmltopdf',
+        '--toc',
+        '-V', 'margin-top=1in',
+        '-V', 'margin-bottom=1in',
+        '-V', 'margin-left=1in',
+        '-V', 'margin-right=1in'
+    )
+}
+
+# Whitespace at the end of each line of section content
+_TRAILING_WS_RE = re.compile(r'[^\S\n]+$', re.MULTILINE)
+
+# Stylesheet written next to HTML output
+_CSS_CONTENT = """
+/* GitRead Documentation Styles */
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    line-height: 1.6;
+    max-width: 900px;
+    margin: 0 auto;
+    padding: 2rem;
+    color: #333;
+}
+
+h1, h2, h3, h4, h5, h6 {
+    color: #2c3e50;
+    margin-top: 2rem;
+    margin-bottom: 1rem;
+}
+
+h1 {
+    border-bottom: 3px solid #3498db;
+    padding-bottom: 0.5rem;
+}
+
+h2 {
+    border-bottom: 1px solid #bdc3c7;
+    padding-bottom: 0.3rem;
+}
+
+code {
+    background-color: #f8f9fa;
+    padding: 0.2rem 0.4rem;
+    border-radius: 3px;
+    font-family: 'SF Mono', Monaco, 'Cascadia Code', monospace;
+}
+
+pre {
+    background-color: #f8f9fa;
+    border: 1px solid #e9ecef;
+    border-radius: 5px;
+    padding: 1rem;
+    overflow-x: auto;
+}
+
+blockquote {
+    border-left: 4px solid #3498db;
+    margin: 1rem 0;
+    padding-left: 1rem;
+    color: #7f8c8d;
+}
+
+table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 1rem 0;
+}
+
+th, td {
+    border: 1px solid #ddd;
+    padding: 0.5rem;
+    text-align: left;
+}
+
+th {
+    background-color: #f8f9fa;
+    font-weight: 600;
+}
+
+.toc {
+    background-color: #f8f9fa;
+    border: 1px solid #e9ecef;
+    border-radius: 5px;
+    padding: 1rem;
+    margin: 2rem 0;
+}
+
+.toc ul {
+    margin: 0;
+    padding-left: 1.5rem;
+}
+
+a {
+    color: #3498db;
+    text-decoration: none;
+}
+
+a:hover {
+    text-decoration: underline;
+}
+
+.metadata {
+    background-color: #f8f9fa;
+    border-left: 4px solid #3498db;
+    padding: 1rem;
+    margin: 2rem 0;
+}
+"""
+
+
+@lru_cache(maxsize=64)
+def _duplicate_header_re(title: str) -> re.Pattern:
+    """Match whole markdown header lines that mention ``title``."""
+    return re.compile(rf'^#[^\n]*{re.escape(title)}[^\n]*\n?', re.MULTILINE)
 
 
 class DocumentFormatter:
     """Agent responsible for formatting and converting documentation."""
     
-    def __init__(self, output_dir="outputs"):
+    # Result of the pandoc availability probe, shared by all instances
+    _pandoc_available_cache: Optional[bool] = None
+    
+    # URL of the shared pandoc server; False once starting one has failed
+    _pandoc_server_url: Any = None
+    _pandoc_server_lock = threading.Lock()
+    
+    def __init__(self, output_dir="outputs", use_pandoc_server: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
+        # Convert HTML through a long-running pandoc server (pandoc >= 3.0)
+        # instead of starting a pandoc process per document
+        self.use_pandoc_server = use_pandoc_server
+        
         # Markdown formatting options
         self.markdown_config = {
             'line_length': 80,
@@ -36,6 +232,10 @@ class DocumentFormatter:
         
         # Check for pandoc availability
         self.pandoc_available = self._check_pandoc()
+        
+        # PDF engine that last produced a PDF, tried first next time
+        self._pdf_engine_cache: Optional[str] = None
+        self._pdf_engine_lock = threading.Lock()
     
     def format_document(self, filled_doc: Dict[str, Any], 
                        output_format: str = 'markdown',
@@ -61,22 +261,104 @@ class DocumentFormatter:
         if output_format == 'markdown':
             return markdown_content
         
-        # Save markdown first
-        markdown_path = self.output_dir / "temp_project_doc.md"
-        with open(markdown_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        return self._convert_markdown(markdown_content, output_format, base_filename)
+    
+    def format_all(self, filled_doc: Dict[str, Any],
+                   formats: Sequence[str] = ('markdown', 'html', 'pdf'),
+                   include_toc: bool = True,
+                   base_filename: str = None) -> Dict[str, str]:
+        """
+        Format the filled documentation into several outputs at once.
         
-        try:
-            if output_format == 'html':
-                return self._convert_to_html(markdown_path, base_filename)
-            elif output_format == 'pdf':
-                return self._convert_to_pdf(markdown_path, base_filename)
-            else:
+        The markdown is generated once; HTML and PDF conversions run
+        concurrently since each waits on its own pandoc process.
+        
+        Args:
+            filled_doc: Filled documentation from section_filler
+            formats: Output formats ('markdown', 'html', 'pdf')
+            include_toc: Whether to include table of contents
+            base_filename: Base filename for output files (without extension)
+            
+        Returns:
+            Mapping of each format to its content (markdown) or file path
+        """
+        for output_format in formats:
+            if output_format not in ('markdown', 'html', 'pdf'):
                 raise ValueError(f"Unsupported output format: {output_format}")
-        finally:
-            # Clean up temporary file
-            if markdown_path.exists():
-                markdown_path.unlink()
+        
+        print(f"📄 Formatting document as {', '.join(formats)}...")
+        markdown_content = self._generate_markdown(filled_doc, include_toc)
+        
+        conversions = [output_format for output_format in formats if output_format != 'markdown']
+        if not conversions:
+            return {output_format: markdown_content for output_format in formats}
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=len(conversions)) as executor:
+            futures = {
+                output_format: executor.submit(self._convert_markdown, markdown_content,
+                                               output_format, base_filename)
+                for output_format in conversions
+            }
+            return {
+                output_format: markdown_content if output_format == 'markdown'
+                else futures[output_format].result()
+                for output_format in formats
+            }
+    
+    def _convert_markdown(self, markdown_content: str, output_format: str,
+                          base_filename: str = None) -> str:
+        """
+        Convert generated markdown to an HTML or PDF file.
+        
+        Args:
+            markdown_content: Generated markdown
+            output_format: Output format ('html', 'pdf')
+            base_filename: Base filename for output files (without extension)
+            
+        Returns:
+            Path to the generated file
+        """
+        # Pandoc reads the markdown from stdin, so no temporary file is needed
+        if output_format == 'html':
+            return self._convert_to_html(markdown_content.encode('utf-8'), base_filename)
+        elif output_format == 'pdf':
+            return self._convert_to_pdf(markdown_content.encode('utf-8'), base_filename,
+                                        markdown_text=markdown_content)
+        else:
+            raise ValueError(f"Unsupported output format: {output_format}")
+    
+    def format_to_path(self, filled_doc: Dict[str, Any], out_path: Path,
+                       include_toc: bool = True) -> str:
+        """
+        Format the filled documentation as markdown and write it to a file.
+        
+        The content is encoded once and written to a sibling temporary file
+        that then replaces ``out_path``, so readers never see a partial file.
+        
+        Args:
+            filled_doc: Filled documentation from section_filler
+            out_path: Destination markdown file
+            include_toc: Whether to include table of contents
+            
+        Returns:
+            The markdown content that was written
+        """
+        markdown_content = self.format_document(filled_doc, 'markdown', include_toc)
+        
+        data = markdown_content.encode('utf-8')
+        out_path = Path(out_path)
+        tmp_path = out_path.with_name(f"{out_path.name}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            # Don't leave a partial temporary file next to the output
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        return markdown_content
     
     def _generate_markdown(self, filled_doc: Dict[str, Any], include_toc: bool = True) -> str:
         """
@@ -89,139 +371,92 @@ class DocumentFormatter:
         Returns:
             Formatted markdown string
         """
-        content = []
+        buf = io.StringIO()
         
         # Document header
         project_name = filled_doc.get('project_name', 'Project Documentation')
-        content.append(f"# {project_name}")
-        content.append("")
+        buf.write(f"# {project_name}\n\n")
         
         # Metadata section
         metadata = filled_doc.get('metadata', {})
         generation_info = filled_doc.get('generation_info', {})
         
         if metadata or generation_info:
-            content.append("---")
-            content.append("")
+            buf.write("---\n\n")
             
             if metadata.get('primary_language'):
-                content.append(f"**Primary Language:** {metadata['primary_language']}")
+                buf.write(f"**Primary Language:** {metadata['primary_language']}\n")
             if metadata.get('project_type'):
-                content.append(f"**Project Type:** {metadata['project_type'].replace('_', ' ').title()}")
+                buf.write(f"**Project Type:** {metadata['project_type'].replace('_', ' ').title()}\n")
             if metadata.get('complexity'):
-                content.append(f"**Complexity:** {metadata['complexity'].title()}")
+                buf.write(f"**Complexity:** {metadata['complexity'].title()}\n")
             
             if generation_info.get('timestamp'):
-                content.append(f"**Generated:** {generation_info['timestamp']}")
+                buf.write(f"**Generated:** {generation_info['timestamp']}\n")
             
-            content.append("")
-            content.append("---")
-            content.append("")
+            buf.write("\n---\n\n")
+        
+        # Sort sections by priority and logical order once for the TOC and body
+        sections = filled_doc.get('sections', {})
+        sorted_sections = self._sort_sections(sections, self._get_section_order())
         
         # Table of contents
         if include_toc:
-            toc = self._generate_toc(filled_doc)
+            toc = self._generate_toc(sorted_sections)
             if toc:
-                content.append("## Table of Contents")
-                content.append("")
-                content.extend(toc)
-                content.append("")
-                content.append("---")
-                content.append("")
+                buf.write("## Table of Contents\n\n")
+                buf.write(toc)
+                buf.write("\n---\n\n")
         
         # Document sections
-        sections = filled_doc.get('sections', {})
-        
-        # Sort sections by priority and logical order
-        section_order = self._get_section_order()
-        sorted_sections = self._sort_sections(sections, section_order)
-        
         for title, section_data in sorted_sections:
-            content.append(f"## {title}")
-            content.append("")
-            
-            section_content = section_data.get('content', '')
-            
             # Clean up section content
-            cleaned_content = self._clean_section_content(section_content, title)
-            content.append(cleaned_content)
-            content.append("")
+            cleaned_content = self._clean_section_content(section_data.get('content', ''), title)
             
             # Add section metadata as comment if in debug mode
-            if section_data.get('fallback_used'):
-                content.append("<!-- Generated using fallback template -->")
-                content.append("")
+            marker = _FALLBACK_MARKER if section_data.get('fallback_used') else ''
+            
+            buf.write(f"## {title}\n\n{cleaned_content}\n\n{marker}")
         
         # Footer
-        content.append("---")
-        content.append("")
-        content.append("## 📄 Documentation Info")
-        content.append("")
-        content.append("*This documentation was generated automatically by **PromptSwitch**.*")
-        content.append("")
-        content.append("**Created by:** [Avikalp Karrahe](https://github.com/Avikalp-Karrahe)")
-        content.append("")
-        content.append("**Connect with me:**")
-        content.append("- 🔗 [LinkedIn](https://www.linkedin.com/in/avikalp-karrahe/)")
-        content.append("- 💼 [GitHub](https://github.com/Avikalp-Karrahe)")
-        content.append("- 🚀 [PromptSwitch Repository](https://github.com/Avikalp-Karrahe/PromptSwitch)")
+        buf.write(_FOOTER)
         
         if generation_info.get('timestamp'):
             timestamp = generation_info['timestamp']
-            content.append("")
-            content.append(f"*Generated on: {timestamp}*")
+            buf.write(f"\n\n*Generated on: {timestamp}*")
         
-        return "\n".join(content)
+        return buf.getvalue()
     
-    def _generate_toc(self, filled_doc: Dict[str, Any]) -> List[str]:
+    def _generate_toc(self, sorted_sections: List[tuple]) -> str:
         """
         Generate table of contents.
         
         Args:
-            filled_doc: Filled documentation data
+            sorted_sections: (title, section_data) tuples from _sort_sections
             
         Returns:
-            List of TOC lines
+            TOC lines, each ending in a newline (empty if there are no sections)
         """
-        toc = []
-        sections = filled_doc.get('sections', {})
-        
-        # Sort sections by priority and logical order
-        section_order = self._get_section_order()
-        sorted_sections = self._sort_sections(sections, section_order)
+        toc = io.StringIO()
         
-        for title, section_data in sorted_sections:
+        for title, _ in sorted_sections:
             # Create anchor link
-            anchor = title.lower().replace(' ', '-').replace('/', '')
-            toc.append(f"- [{title}](#{anchor})")
+            anchor = title.lower().translate(_ANCHOR_TABLE)
+            toc.write(f"- [{title}](#{anchor})\n")
         
-        return toc
+        return toc.getvalue()
     
-    def _get_section_order(self) -> List[str]:
+    def _get_section_order(self) -> Tuple[str, ...]:
         """
         Get the logical order for documentation sections.
         
         Returns:
-            List of section titles in preferred order
-        """
-        return [
-            'Project Overview',
-            'Features',
-            'Technology Stack',
-            'Installation',
-            'Configuration',
-            'Usage',
-            'API Documentation',
-            'Project Structure',
-            'Development',
-            'Testing',
-            'Deployment',
-            'Contributing',
-            'License'
-        ]
+            Tuple of section titles in preferred order
+        """
+        return _SECTION_ORDER
     
     def _sort_sections(self, sections: Dict[str, Any], 
-                      preferred_order: List[str]) -> List[tuple]:
+                      preferred_order: Sequence[str] = _SECTION_ORDER) -> List[tuple]:
         """
         Sort sections by preferred order and priority.
         
@@ -232,18 +467,18 @@ class DocumentFormatter:
         Returns:
             List of (title, section_data) tuples in sorted order
         """
+        if preferred_order is _SECTION_ORDER:
+            order_lookup = _SECTION_ORDER_INDEX
+        else:
+            order_lookup = {title: index for index, title in enumerate(preferred_order)}
+        unknown_index = len(preferred_order)  # Put unknown sections at end
+        
         def get_sort_key(item):
             title, section_data = item
             
-            # Primary sort: preferred order
-            try:
-                order_index = preferred_order.index(title)
-            except ValueError:
-                order_index = len(preferred_order)  # Put unknown sections at end
-            
-            # Secondary sort: priority
-            priority = section_data.get('priority', 'medium')
-            priority_value = {'high': 0, 'medium': 1, 'low': 2}.get(priority, 1)
+            # Primary sort: preferred order, secondary sort: priority
+            order_index = order_lookup.get(title, unknown_index)
+            priority_value = _PRIORITY_ORDER.get(section_data.get('priority', 'medium'), 1)
             
             return (order_index, priority_value)
         
@@ -263,46 +498,41 @@ class DocumentFormatter:
         if not content:
             return f"*{title} section is empty.*"
         
-        lines = content.split('\n')
-        cleaned_lines = []
+        # Remove duplicate headers (section title already added); only
+        # content mentioning the title can contain one
+        if title in content:
+            content = _duplicate_header_re(title).sub('', content)
         
-        for line in lines:
-            # Remove duplicate headers (section title already added)
-            if line.startswith('#') and title in line:
-                continue
-            
-            # Clean up extra whitespace
-            line = line.rstrip()
-            cleaned_lines.append(line)
-        
-        # Remove leading/trailing empty lines
-        while cleaned_lines and not cleaned_lines[0]:
-            cleaned_lines.pop(0)
-        while cleaned_lines and not cleaned_lines[-1]:
-            cleaned_lines.pop()
-        
-        return '\n'.join(cleaned_lines)
+        # Clean up trailing whitespace and leading/trailing empty lines
+        return _TRAILING_WS_RE.sub('', content).strip('\n')
     
-    def _check_pandoc(self) -> bool:
+    @classmethod
+    def _check_pandoc(cls) -> bool:
         """
         Check if pandoc is available for format conversion.
         
+        The probe runs once per process; later instances reuse the result.
+        
         Returns:
             True if pandoc is available
         """
-        try:
-            result = subprocess.run(['pandoc', '--version'], 
-                                  capture_output=True, text=True)
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        if cls._pandoc_available_cache is None:
+            import subprocess
+            
+            try:
+                result = subprocess.run(['pandoc', '--version'], 
+                                      capture_output=True, text=True)
+                cls._pandoc_available_cache = result.returncode == 0
+            except FileNotFoundError:
+                cls._pandoc_available_cache = False
+        return cls._pandoc_available_cache
     
-    def _convert_to_html(self, markdown_path: Path, base_filename: str = None) -> str:
+    def _convert_to_html(self, markdown_bytes: bytes, base_filename: str = None) -> str:
         """
         Convert markdown to HTML using pandoc.
         
         Args:
-            markdown_path: Path to markdown file
+            markdown_bytes: UTF-8 encoded markdown, piped to pandoc on stdin
             base_filename: Base filename for output (without extension)
             
         Returns:
@@ -319,9 +549,27 @@ class DocumentFormatter:
         
         html_path = self.output_dir / html_filename
         
+        if self.use_pandoc_server:
+            server_url = self._get_pandoc_server()
+            if server_url:
+                try:
+                    html = self._convert_with_server(server_url, markdown_bytes, 'html', {
+                        'standalone': True,
+                        'table-of-contents': True,
+                        'highlight-style': 'github',
+                        'variables': {'css': [self._create_css_file()]}
+                    })
+                    html_path.write_text(html, encoding='utf-8')
+                    print(f"✅ HTML generated: {html_path}")
+                    return str(html_path)
+                except (OSError, ValueError, RuntimeError) as e:
+                    print(f"⚠️ Pandoc server conversion failed, running pandoc directly: {e}")
+        
+        import subprocess
+        
         cmd = [
             'pandoc',
-            str(markdown_path),
+            '-f', 'markdown',
             '-o', str(html_path),
             '--standalone',
             '--toc',
@@ -330,20 +578,106 @@ class DocumentFormatter:
         ]
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = subprocess.run(cmd, input=markdown_bytes, capture_output=True, check=True)
             print(f"✅ HTML generated: {html_path}")
             return str(html_path)
         except subprocess.CalledProcessError as e:
-            print(f"❌ HTML conversion failed: {e.stderr}")
+            print(f"❌ HTML conversion failed: {e.stderr.decode('utf-8', 'replace')}")
             raise
     
-    def _convert_to_pdf(self, markdown_path: Path, base_filename: str = None) -> str:
+    @classmethod
+    def _get_pandoc_server(cls) -> Optional[str]:
+        """
+        Start a pandoc server on first use and return its URL.
+        
+        The server is shared by all instances and threads, and stopped at
+        interpreter exit. If it cannot be started, None is returned from
+        then on.
+        
+        Returns:
+            Base URL of the running server, or None
+        """
+        with cls._pandoc_server_lock:
+            if cls._pandoc_server_url is None:
+                cls._start_pandoc_server()
+        return cls._pandoc_server_url or None
+    
+    @classmethod
+    def _start_pandoc_server(cls) -> None:
+        """Launch the shared pandoc server and record its URL if it comes up."""
+        import atexit
+        import socket
+        import subprocess
+        
+        cls._pandoc_server_url = False
+        
+        # Reserve a free local port for the server
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        
+        try:
+            process = subprocess.Popen(['pandoc', 'server', f'--port={port}'],
+                                       stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.DEVNULL)
+        except OSError:
+            return
+        atexit.register(process.terminate)
+        
+        # Wait for the server to accept connections
+        deadline = time.monotonic() + _PANDOC_SERVER_STARTUP_TIMEOUT
+        while process.poll() is None and time.monotonic() < deadline:
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+            except OSError:
+                time.sleep(0.05)
+                continue
+            cls._pandoc_server_url = f"http://127.0.0.1:{port}"
+            print(f"🚀 Pandoc server started on port {port}")
+            break
+        else:
+            process.terminate()
+            print("⚠️ Pandoc server unavailable, running pandoc per conversion")
+    
+    def _convert_with_server(self, server_url: str, markdown_bytes: bytes,
+                             to_format: str, options: Dict[str, Any]) -> str:
+        """
+        Convert markdown through the pandoc server.
+        
+        Args:
+            server_url: Base URL from _get_pandoc_server
+            markdown_bytes: UTF-8 encoded markdown
+            to_format: Pandoc output format
+            options: Additional pandoc server options
+            
+        Returns:
+            Converted document text
+        """
+        import urllib.request
+        
+        payload = {'text': markdown_bytes.decode('utf-8'), 'from': 'markdown', 'to': to_format, **options}
+        request = urllib.request.Request(
+            server_url,
+            data=json.dumps(payload).encode('utf-8'),
+            headers={'Content-Type': 'application/json', 'Accept': 'application/json'}
+        )
+        with urllib.request.urlopen(request, timeout=_PANDOC_SERVER_TIMEOUT) as response:
+            result = json.loads(response.read())
+        
+        if not isinstance(result, dict) or 'output' not in result:
+            error = result.get('error') if isinstance(result, dict) else result
+            raise RuntimeError(f"Pandoc server error: {error}")
+        return result['output']
+    
+    def _convert_to_pdf(self, markdown_bytes: bytes, base_filename: str = None,
+                        markdown_text: str = None) -> str:
         """
         Convert markdown to PDF using pandoc with multiple fallback engines.
         
         Args:
-            markdown_path: Path to markdown file
+            markdown_bytes: UTF-8 encoded markdown, piped to pandoc on stdin
             base_filename: Base filename for output (without extension)
+            markdown_text: The same markdown as a string, used by the Python fallback
             
         Returns:
             Path to generated PDF file
@@ -362,63 +696,45 @@ class DocumentFormatter:
         
         pdf_path = self.output_dir / pdf_filename
         
-        # Try different PDF engines in order of preference
-        engines = ['xelatex', 'pdflatex', 'wkhtmltopdf']
+        import subprocess
+        
+        # Try installed PDF engines in order of preference, starting with
+        # the one that worked last time
+        engines = [engine for engine in _PDF_ENGINE_ARGS if shutil.which(engine)]
+        with self._pdf_engine_lock:
+            cached_engine = self._pdf_engine_cache
+        if cached_engine in engines:
+            engines.remove(cached_engine)
+            engines.insert(0, cached_engine)
         
         for engine in engines:
             try:
                 print(f"🔄 Trying PDF conversion with {engine}...")
                 
-                if engine == 'wkhtmltopdf':
-                    # Different command structure for wkhtmltopdf
-                    cmd = [
-                        'pandoc',
-                        str(markdown_path),
-                        '-o', str(pdf_path),
-                        '--pdf-engine=wkhtmltopdf',
-                        '--toc',
-                        '-V', 'margin-top=1in',
-                        '-V', 'margin-bottom=1in',
-                        '-V', 'margin-left=1in',
-                        '-V', 'margin-right=1in'
-                    ]
-                else:
-                    # LaTeX-based engines with enhanced formatting to match Reference.pdf template
-                    cmd = [
-                        'pandoc',
-                        str(markdown_path),
-                        '-o', str(pdf_path),
-                        f'--pdf-engine={engine}',
-                        '--toc',
-                        '--toc-depth=3',
-                        '-V', 'geometry:margin=1in',
-                        '-V', 'fontsize=11pt',
-                        '-V', 'documentclass=article',
-                        '-V', 'colorlinks=true',
-                        '-V', 'linkcolor=blue',
-                        '-V', 'urlcolor=blue',
-                        '--number-sections',
-                        '--standalone'
-                    ]
+                cmd = ('pandoc', '-f', 'markdown', '-o', str(pdf_path)) + _PDF_ENGINE_ARGS[engine]
                 
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+                result = subprocess.run(cmd, input=markdown_bytes, capture_output=True, check=True)
                 print(f"✅ PDF generated with {engine}: {pdf_path}")
+                with self._pdf_engine_lock:
+                    self._pdf_engine_cache = engine
                 return str(pdf_path)
                 
             except subprocess.CalledProcessError as e:
-                print(f"⚠️ {engine} failed: {e.stderr.strip() if e.stderr else 'Unknown error'}")
+                print(f"⚠️ {engine} failed: {e.stderr.decode('utf-8', 'replace').strip() if e.stderr else 'Unknown error'}")
                 continue
         
         # If all pandoc engines failed, try Python fallback
+        try:
+            from .pdf_converter import PythonPDFConverter
+        except ImportError:
+            PythonPDFConverter = None
+        
         if PythonPDFConverter:
             try:
                 print("🔄 Trying Python-based PDF conversion...")
                 converter = PythonPDFConverter(str(self.output_dir))
                 
-                # Read the markdown content
-                with open(markdown_path, 'r', encoding='utf-8') as f:
-                    markdown_content = f.read()
-                
+                markdown_content = markdown_text if markdown_text is not None else markdown_bytes.decode('utf-8')
                 result_path = converter.convert_markdown_to_pdf(markdown_content, "project_doc.pdf")
                 return result_path
                 
@@ -439,112 +755,16 @@ class DocumentFormatter:
     
     def _create_css_file(self) -> str:
         """
-        Create a CSS file for HTML styling.
+        Create a CSS file for HTML styling if the output directory lacks one.
         
         Returns:
             Path to CSS file
         """
         css_path = self.output_dir / "style.css"
         
-        css_content = """
-/* GitRead Documentation Styles */
-
-body {
-    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-    line-height: 1.6;
-    max-width: 900px;
-    margin: 0 auto;
-    padding: 2rem;
-    color: #333;
-}
-
-h1, h2, h3, h4, h5, h6 {
-    color: #2c3e50;
-    margin-top: 2rem;
-    margin-bottom: 1rem;
-}
-
-h1 {
-    border-bottom: 3px solid #3498db;
-    padding-bottom: 0.5rem;
-}
-
-h2 {
-    border-bottom: 1px solid #bdc3c7;
-    padding-bottom: 0.3rem;
-}
-
-code {
-    background-color: #f8f9fa;
-    padding: 0.2rem 0.4rem;
-    border-radius: 3px;
-    font-family: 'SF Mono', Monaco, 'Cascadia Code', monospace;
-}
-
-pre {
-    background-color: #f8f9fa;
-    border: 1px solid #e9ecef;
-    border-radius: 5px;
-    padding: 1rem;
-    overflow-x: auto;
-}
-
-blockquote {
-    border-left: 4px solid #3498db;
-    margin: 1rem 0;
-    padding-left: 1rem;
-    color: #7f8c8d;
-}
-
-table {
-    border-collapse: collapse;
-    width: 100%;
-    margin: 1rem 0;
-}
-
-th, td {
-    border: 1px solid #ddd;
-    padding: 0.5rem;
-    text-align: left;
-}
-
-th {
-    background-color: #f8f9fa;
-    font-weight: 600;
-}
-
-.toc {
-    background-color: #f8f9fa;
-    border: 1px solid #e9ecef;
-    border-radius: 5px;
-    padding: 1rem;
-    margin: 2rem 0;
-}
-
-.toc ul {
-    margin: 0;
-    padding-left: 1.5rem;
-}
-
-a {
-    color: #3498db;
-    text-decoration: none;
-}
-
-a:hover {
-    text-decoration: underline;
-}
-
-.metadata {
-    background-color: #f8f9fa;
-    border-left: 4px solid #3498db;
-    padding: 1rem;
-    margin: 2rem 0;
-}
-"""
-        
-        with open(css_path, 'w', encoding='utf-8') as f:
-            f.write(css_content)
+        # The stylesheet is static, so only write it the first time
+        if not css_path.exists():
+            css_path.write_text(_CSS_CONTENT, encoding='utf-8')
         
         return str(css_path)
     
@@ -562,55 +782,50 @@ a:hover {
         generation_info = filled_doc.get('generation_info', {})
         metadata = filled_doc.get('metadata', {})
         
-        report = []
-        report.append("# GitRead Generation Report")
-        report.append("")
+        report = io.StringIO()
+        report.write("# GitRead Generation Report\n\n")
         
-        # Basic statistics
+        # Basic statistics and section table rows, gathered in one pass
         total_sections = len(sections)
-        total_words = sum(section.get('word_count', 0) for section in sections.values())
-        fallback_sections = sum(1 for section in sections.values() if section.get('fallback_used'))
-        
-        report.append("## Statistics")
-        report.append("")
-        report.append(f"- **Total Sections:** {total_sections}")
-        report.append(f"- **Total Words:** {total_words:,}")
-        report.append(f"- **Fallback Sections:** {fallback_sections}")
-        report.append(f"- **Success Rate:** {((total_sections - fallback_sections) / total_sections * 100):.1f}%")
-        report.append("")
-        
-        # Section details
-        report.append("## Section Details")
-        report.append("")
-        report.append("| Section | Priority | Words | Status |")
-        report.append("|---------|----------|-------|--------|")
+        total_words = 0
+        fallback_sections = 0
+        rows = io.StringIO()
         
         for title, section in sections.items():
             priority = section.get('priority', 'medium')
             word_count = section.get('word_count', 0)
-            status = "Fallback" if section.get('fallback_used') else "Generated"
-            report.append(f"| {title} | {priority} | {word_count} | {status} |")
+            fallback_used = section.get('fallback_used')
+            total_words += word_count
+            fallback_sections += bool(fallback_used)
+            status = "Fallback" if fallback_used else "Generated"
+            rows.write(f"| {title} | {priority} | {word_count} | {status} |\n")
+        
+        report.write("## Statistics\n\n")
+        report.write(f"- **Total Sections:** {total_sections}\n")
+        report.write(f"- **Total Words:** {total_words:,}\n")
+        report.write(f"- **Fallback Sections:** {fallback_sections}\n")
+        report.write(f"- **Success Rate:** {((total_sections - fallback_sections) / total_sections * 100):.1f}%\n\n")
         
-        report.append("")
+        # Section details
+        report.write("## Section Details\n\n")
+        report.write("| Section | Priority | Words | Status |\n")
+        report.write("|---------|----------|-------|--------|\n")
+        report.write(rows.getvalue())
         
         # Metadata
         if metadata:
-            report.append("## Project Metadata")
-            report.append("")
+            report.write("\n## Project Metadata\n\n")
             for key, value in metadata.items():
-                report.append(f"- **{key.replace('_', ' ').title()}:** {value}")
-            report.append("")
+                report.write(f"- **{key.replace('_', ' ').title()}:** {value}\n")
         
         # Generation info
         if generation_info:
-            report.append("## Generation Information")
-            report.append("")
+            report.write("\n## Generation Information\n\n")
             for key, value in generation_info.items():
                 if key != 'timestamp':
-                    report.append(f"- **{key.replace('_', ' ').title()}:** {value}")
-            report.append("")
+                    report.write(f"- **{key.replace('_', ' ').title()}:** {value}\n")
         
-        return "\n".join(report)
+        return report.getvalue()
     
     def save_summary_report(self, filled_doc: Dict[str, Any]) -> Path:
         """
@@ -625,8 +840,7 @@ a:hover {
         report_content = self.generate_summary_report(filled_doc)
         report_path = self.output_dir / "generation_report.md"
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        report_path.write_text(report_content, encoding='utf-8')
         
         print(f"📊 Generation report saved: {report_path}")
         return report_path
@@ -650,13 +864,9 @@ if __name__ == "__main__":
     
     formatter = DocumentFormatter()
     
-    # Generate markdown
-    markdown_content = formatter.format_document(filled_doc, 'markdown')
-    
-    # Save markdown
+    # Generate and save markdown
     output_path = formatter.output_dir / "test_project_doc.md"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(markdown_content)
+    formatter.format_to_path(filled_doc, output_path)
     
     print(f"✅ Test documentation generated: {output_path}")
     
@@ -9,8 +9,127 @@ Extracts key information needed for documentation generation.
 import os
 import json
 import re
+import fnmatch
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
+
+# orjson is an optional, faster drop-in for the stdlib decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Maximum number of parsed README and dependency files kept per parser
+_FILE_CACHE_SIZE = 4096
+
+# Source extensions whose lines are counted in the repository statistics
+_CODE_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.java', '.go', '.rs', '.cpp', '.c', '.cs', '.php', '.rb'})
+
+# Read size used when counting lines
+_LINE_COUNT_CHUNK = 1 << 20
+
+# Files left out of the line total: oversized, minified or vendored code
+_LINE_COUNT_MAX_BYTES = 2_000_000
+_MINIFIED_SUFFIXES = ('.min.js', '.min.css')
+_VENDOR_DIRS = frozenset({'vendor', 'third_party'})
+
+# Threads counting lines while the walk continues; the reads release the GIL
+_LINE_COUNT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# VCS, dependency, cache and build output directories; they are counted
+# but never descended into
+_SKIP_DIRS = frozenset({
+    '.git', 'node_modules', 'venv', '.venv', 'env', '__pycache__',
+    '.mypy_cache', '.pytest_cache', 'target', 'build', 'dist', '.tox', '.next'
+})
+
+# Depth of the structure tree; the walk keeps listings for this many levels
+_TREE_MAX_DEPTH = 3
+
+# Glob patterns identifying test files, combined into one regex matched
+# against every file name
+_TEST_FILE_PATTERNS = ['*test*.py', '*_test.py', 'test_*.py', '*.test.js', '*.spec.js']
+_TEST_FILE_RE = re.compile('|'.join(fnmatch.translate(pattern) for pattern in _TEST_FILE_PATTERNS))
+
+# Root files whose presence identifies a test framework
+_PYTEST_CONFIG_FILES = ('pytest.ini', 'conftest.py')
+_JEST_CONFIG_FILES = ('jest.config.js', 'jest.config.ts', 'jest.config.mjs',
+                      'jest.config.cjs', 'jest.config.json')
+
+# Shared config files and the section header that marks pytest settings
+_PYTEST_SECTION_FILES = {
+    'tox.ini': '[pytest]',
+    'setup.cfg': '[tool:pytest]',
+    'pyproject.toml': '[tool.pytest',
+}
+
+# Distribution name at the start of a requirements.txt line
+_REQUIREMENT_NAME_RE = re.compile(r'[A-Za-z0-9._-]+')
+
+# Header lines, badges and links of a README in one scan; badges and links
+# are lookaheads so overlapping matches (a badge inside a link) are all seen
+_README_RE = re.compile(
+    r'(?P<header>^#)'
+    r'|(?=(?P<badge>!\[.*?\]\((?P<badge_url>https://.*?)\)))'
+    r'|(?=(?P<link>\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^\)]+)\)))',
+    re.MULTILINE)
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson's C decoder."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _count_lines(path: str) -> int:
+    """
+    Count the lines in a file without decoding it.
+    
+    A final line without a trailing newline still counts, matching
+    iteration over the file in text mode. Unreadable files and files
+    over ``_LINE_COUNT_MAX_BYTES`` count as zero lines.
+    
+    Args:
+        path (str): Path to the file
+        
+    Returns:
+        int: Number of lines
+    """
+    lines = 0
+    last = b''
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            if os.fstat(f.fileno()).st_size > _LINE_COUNT_MAX_BYTES:
+                return 0  # Skip generated or bundled files
+            while True:
+                chunk = f.read(_LINE_COUNT_CHUNK)
+                if not chunk:
+                    break
+                lines += chunk.count(b'\n')
+                last = chunk[-1:]
+    except OSError:
+        return 0  # Skip inaccessible files
+    if last and last != b'\n':
+        lines += 1
+    return lines
+
+
+@dataclass
+class _WalkResult:
+    """Aggregates gathered by a single traversal of the repository."""
+    total_files: int = 0
+    total_dirs: int = 0
+    max_depth: int = 0
+    language_counts: Counter = field(default_factory=Counter)
+    code_files: int = 0
+    code_line_total: int = 0
+    test_files: List[str] = field(default_factory=list)
+    # Entries of the shallow directories, or None where listing failed
+    listings: Dict[str, Optional[List[os.DirEntry]]] = field(default_factory=dict)
 
 
 class RepoParser:
@@ -40,6 +159,46 @@ class RepoParser:
             '.gitignore', '.dockerignore',
             'Makefile', 'makefile'
         ]
+        
+        self.language_extensions = {
+            'python': ['.py', '.pyw'],
+            'javascript': ['.js', '.jsx', '.mjs'],
+            'typescript': ['.ts', '.tsx'],
+            'java': ['.java'],
+            'go': ['.go'],
+            'rust': ['.rs'],
+            'cpp': ['.cpp', '.cc', '.cxx', '.c++'],
+            'c': ['.c'],
+            'csharp': ['.cs'],
+            'php': ['.php'],
+            'ruby': ['.rb'],
+            'swift': ['.swift'],
+            'kotlin': ['.kt', '.kts'],
+            'scala': ['.scala'],
+            'html': ['.html', '.htm'],
+            'css': ['.css', '.scss', '.sass'],
+            'shell': ['.sh', '.bash', '.zsh'],
+            'yaml': ['.yml', '.yaml'],
+            'json': ['.json'],
+            'xml': ['.xml'],
+            'markdown': ['.md', '.markdown']
+        }
+        
+        # Extension to language lookup; the first language listing an
+        # extension wins
+        self._ext_to_lang = {}
+        for language, extensions in self.language_extensions.items():
+            for ext in extensions:
+                self._ext_to_lang.setdefault(ext, language)
+        
+        # (repo path, walk result) from the last repository traversal
+        self._walk_cache = None
+        
+        # (repo path, names of existing root entries) from the last parse
+        self._root_names_cache = None
+        
+        # Parsed files keyed by (path, mtime_ns, size, kind)
+        self._file_cache = {}
     
     def parse_repository(self, repo_path: Path) -> Dict[str, Any]:
         """
@@ -55,17 +214,25 @@ class RepoParser:
         
         print(f"📁 Parsing repository structure at {repo_path}")
         
+        # Walk the tree and list the root afresh for every parse
+        self._walk_cache = None
+        self._root_names_cache = None
+        
+        structure = self._analyze_structure(repo_path)
+        readme = self._parse_readme(repo_path)
+        dependencies = self._parse_dependencies(repo_path)
+        
         repo_data = {
             'path': str(repo_path),
             'name': repo_path.name,
-            'structure': self._analyze_structure(repo_path),
-            'readme': self._parse_readme(repo_path),
-            'dependencies': self._parse_dependencies(repo_path),
+            'structure': structure,
+            'readme': readme,
+            'dependencies': dependencies,
             'languages': self._detect_languages(repo_path),
             'config_files': self._find_config_files(repo_path),
             'entry_points': self._find_entry_points(repo_path),
             'documentation': self._find_documentation(repo_path),
-            'tests': self._find_tests(repo_path),
+            'tests': self._find_tests(repo_path, dependencies),
             'ci_cd': self._find_ci_cd(repo_path),
             'license': self._find_license(repo_path),
             'statistics': self._calculate_statistics(repo_path)
@@ -84,8 +251,9 @@ class RepoParser:
             'tree': self._build_tree(repo_path)
         }
         
-        # Get root level files and directories
-        for item in repo_path.iterdir():
+        # Get root level files and directories from the walk's root listing
+        walk = self._walk_once(repo_path)
+        for item in walk.listings.get(str(repo_path)) or ():
             if item.name.startswith('.'):
                 continue  # Skip hidden files for now
             
@@ -95,43 +263,177 @@ class RepoParser:
                 structure['directories'].append(item.name)
         
         # Calculate statistics
-        structure['total_files'] = sum(1 for _ in repo_path.rglob('*') if _.is_file())
-        structure['max_depth'] = self._calculate_max_depth(repo_path)
+        structure['total_files'] = walk.total_files
+        structure['max_depth'] = walk.max_depth
         
         return structure
     
-    def _build_tree(self, repo_path: Path, max_depth: int = 3) -> Dict[str, Any]:
-        """Build a tree representation of the repository structure."""
-        def _build_node(path: Path, current_depth: int = 0) -> Dict[str, Any]:
+    def _walk_once(self, repo_path: Path) -> _WalkResult:
+        """
+        Traverse the repository once and gather every tree-wide aggregate.
+        
+        Directories are visited in the same pre-order as ``Path.rglob``,
+        entries within a directory in ``os.scandir`` order. Symlinked
+        directories and those in ``_SKIP_DIRS`` are listed but not
+        descended into. Code files are line-counted on a thread pool while
+        the walk continues, except minified ones and those under vendor or
+        third_party directories. The listings of the top levels are kept
+        for the structure tree. The result is kept for the most recently
+        walked repository.
+        
+        Args:
+            repo_path (Path): Path to the repository root
+            
+        Returns:
+            _WalkResult: File, directory, language, line and test file aggregates
+        """
+        root = str(repo_path)
+        if self._walk_cache is not None and self._walk_cache[0] == root:
+            return self._walk_cache[1]
+        
+        walk = _WalkResult()
+        ext_to_lang = self._ext_to_lang
+        line_counts = []
+        
+        with ThreadPoolExecutor(max_workers=_LINE_COUNT_WORKERS) as executor:
+            stack = [(root, '', 0, False)]
+            while stack:
+                dir_path, rel_prefix, depth, vendored = stack.pop()
+                try:
+                    with os.scandir(dir_path) as it:
+                        entries = list(it)
+                except OSError:
+                    if depth < _TREE_MAX_DEPTH:
+                        walk.listings[dir_path] = None
+                    continue
+                walk.max_depth = max(walk.max_depth, depth)
+                if depth < _TREE_MAX_DEPTH:
+                    walk.listings[dir_path] = entries
+                
+                subdirs = []
+                for entry in entries:
+                    name = entry.name
+                    rel_path = rel_prefix + name
+                    
+                    try:
+                        is_dir = entry.is_dir()
+                        is_file = not is_dir and entry.is_file()
+                    except OSError:
+                        continue
+                    
+                    if is_dir:
+                        walk.total_dirs += 1
+                        if name not in _SKIP_DIRS and not entry.is_symlink():
+                            subdirs.append((entry.path, rel_path + os.sep, depth + 1,
+                                            vendored or name in _VENDOR_DIRS))
+                    elif is_file:
+                        walk.total_files += 1
+                        
+                        if _TEST_FILE_RE.match(name):
+                            walk.test_files.append(rel_path)
+                        
+                        # Same rule as Path.suffix: no suffix for a leading or trailing dot
+                        stem, _, ext = name.rpartition('.')
+                        suffix = '.' + ext.lower() if stem and ext else ''
+                        language = ext_to_lang.get(suffix)
+                        if language:
+                            walk.language_counts[language] += 1
+                        
+                        if suffix in _CODE_EXTENSIONS:
+                            walk.code_files += 1
+                            if not vendored and not name.endswith(_MINIFIED_SUFFIXES):
+                                line_counts.append(executor.submit(_count_lines, entry.path))
+                
+                # Reversed so the next pop visits the first subdirectory
+                stack.extend(reversed(subdirs))
+            
+            walk.code_line_total = sum(future.result() for future in line_counts)
+        
+        self._walk_cache = (root, walk)
+        return walk
+    
+    def _root_names(self, repo_path: Path) -> frozenset:
+        """
+        Names of the existing entries at the repository root.
+        
+        The root is listed once per parse so that probes for well-known
+        files are set lookups instead of one stat call each. Dangling
+        symlinks are left out, as ``Path.exists`` would report them missing.
+        
+        Args:
+            repo_path (Path): Path to the repository root
+            
+        Returns:
+            frozenset: Entry names
+        """
+        root = str(repo_path)
+        if self._root_names_cache is not None and self._root_names_cache[0] == root:
+            return self._root_names_cache[1]
+        
+        names = set()
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir() or entry.is_file():
+                            names.add(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        
+        root_names = frozenset(names)
+        self._root_names_cache = (root, root_names)
+        return root_names
+    
+    def _build_tree(self, repo_path: Path, max_depth: int = _TREE_MAX_DEPTH) -> Dict[str, Any]:
+        """
+        Build a tree representation of the repository structure.
+        
+        Directory listings captured by the repository walk are reused, with
+        the walk's cached ``DirEntry`` type information, so only levels
+        deeper than the walk kept are scanned here. Like the walk, the tree
+        does not descend into symlinked directories or those in
+        ``_SKIP_DIRS``; they are shown truncated.
+        """
+        listings = self._walk_once(repo_path).listings
+        
+        def _list_dir(path: str) -> List[os.DirEntry]:
+            if path in listings:
+                entries = listings[path]
+                if entries is None:
+                    raise PermissionError(path)
+                return entries
+            with os.scandir(path) as it:
+                return list(it)
+        
+        def _build_node(path: str, name: str, is_dir: bool, current_depth: int = 0,
+                        expand: bool = True) -> Dict[str, Any]:
             if current_depth >= max_depth:
                 return {'type': 'truncated', 'name': '...'}
             
             node = {
-                'name': path.name,
-                'type': 'directory' if path.is_dir() else 'file',
+                'name': name,
+                'type': 'directory' if is_dir else 'file',
                 'children': []
             }
             
-            if path.is_dir():
+            if is_dir and not expand:
+                node['children'] = [{'type': 'truncated', 'name': '...'}]
+            elif is_dir:
                 try:
-                    children = sorted(path.iterdir(), key=lambda x: (x.is_file(), x.name.lower()))
+                    children = sorted(_list_dir(path), key=lambda x: (x.is_file(), x.name.lower()))
                     for child in children:
                         if not child.name.startswith('.'):
-                            node['children'].append(_build_node(child, current_depth + 1))
+                            expand = child.name not in _SKIP_DIRS and not child.is_symlink()
+                            node['children'].append(
+                                _build_node(child.path, child.name, child.is_dir(), current_depth + 1, expand))
                 except PermissionError:
                     node['children'] = [{'type': 'error', 'name': 'Permission denied'}]
             
             return node
         
-        return _build_node(repo_path)
-    
-    def _calculate_max_depth(self, repo_path: Path) -> int:
-        """Calculate the maximum directory depth."""
-        max_depth = 0
-        for root, dirs, files in os.walk(repo_path):
-            depth = len(Path(root).relative_to(repo_path).parts)
-            max_depth = max(max_depth, depth)
-        return max_depth
+        return _build_node(str(repo_path), repo_path.name, repo_path.is_dir())
     
     def _parse_readme(self, repo_path: Path) -> Dict[str, Any]:
         """Parse README file content."""
@@ -145,91 +447,136 @@ class RepoParser:
         }
         
         # Find README file
-        for readme_name in self.supported_readme_files:
+        root_names = self._root_names(repo_path)
+        readme_name = next((name for name in self.supported_readme_files if name in root_names), None)
+        if readme_name:
             readme_path = repo_path / readme_name
-            if readme_path.exists():
-                readme_data['found'] = True
-                readme_data['filename'] = readme_name
+            readme_data['found'] = True
+            readme_data['filename'] = readme_name
+            
+            try:
+                content, sections, badges, links = self._parse_cached(
+                    readme_path, 'readme', lambda: self._read_readme(readme_path))
                 
-                try:
-                    with open(readme_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    readme_data['content'] = content
-                    readme_data['sections'] = self._extract_sections(content)
-                    readme_data['badges'] = self._extract_badges(content)
-                    readme_data['links'] = self._extract_links(content)
-                    
-                except Exception as e:
-                    print(f"⚠️ Could not read README: {e}")
-                    readme_data['error'] = str(e)
+                readme_data['content'] = content
+                readme_data['sections'] = sections
+                readme_data['badges'] = badges
+                readme_data['links'] = links
                 
-                break
+            except Exception as e:
+                print(f"⚠️ Could not read README: {e}")
+                readme_data['error'] = str(e)
         
         return readme_data
     
-    def _extract_sections(self, content: str) -> List[Dict[str, str]]:
-        """Extract sections from markdown content."""
+    def _read_readme(self, readme_path: Path) -> Tuple[str, List[Dict[str, str]], List[str], List[Dict[str, str]]]:
+        """Read a README and extract its sections, badges and links."""
+        with open(readme_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        return (content,) + self._scan_readme(content)
+    
+    def _parse_cached(self, file_path: Path, kind: str, parse: Callable[[], Any]) -> Any:
+        """
+        Return the parsed form of a file, reusing it while the file is unchanged.
+        
+        Entries are keyed by path, modification time and size, so a file is
+        only re-read and re-parsed after it changes. Cached values are shared
+        between calls and must not be mutated.
+        
+        Args:
+            file_path (Path): File to parse
+            kind (str): Parser identifier, part of the cache key
+            parse (Callable): Reads and parses the file on a cache miss
+            
+        Returns:
+            Any: The parsed value
+        """
+        stat = file_path.stat()
+        cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size, kind)
+        if cache_key in self._file_cache:
+            return self._file_cache[cache_key]
+        
+        parsed = parse()
+        if len(self._file_cache) >= _FILE_CACHE_SIZE:
+            del self._file_cache[next(iter(self._file_cache))]
+        self._file_cache[cache_key] = parsed
+        return parsed
+    
+    def _scan_readme(self, content: str) -> Tuple[List[Dict[str, str]], List[str], List[Dict[str, str]]]:
+        """
+        Extract sections, badge URLs and links from markdown in a single pass.
+        
+        A section starts at every line beginning with '#' and runs to the
+        next one; untitled sections are dropped. Badges and links are each
+        non-overlapping among themselves but may overlap one another, so a
+        badge nested in a link yields both.
+        
+        Args:
+            content (str): Markdown content
+            
+        Returns:
+            Tuple: Sections, badge URLs and links
+        """
         sections = []
-        lines = content.split('\n')
+        badges = []
+        links = []
         
         current_section = None
-        current_content = []
+        body_start = 0
+        badge_end = link_end = 0
         
-        for line in lines:
-            # Check for markdown headers
-            if line.startswith('#'):
+        for match in _README_RE.finditer(content):
+            if match.group('header') is not None:
                 # Save previous section
                 if current_section:
                     sections.append({
                         'title': current_section,
-                        'content': '\n'.join(current_content).strip()
+                        'content': content[body_start:match.start()].strip()
                     })
                 
                 # Start new section
-                current_section = line.lstrip('#').strip()
-                current_content = []
-            else:
-                current_content.append(line)
+                line_end = content.find('\n', match.start())
+                if line_end == -1:
+                    line_end = len(content)
+                current_section = content[match.start():line_end].lstrip('#').strip()
+                body_start = line_end + 1
+            elif match.group('badge') is not None:
+                if match.start() >= badge_end:
+                    badges.append(match.group('badge_url'))
+                    badge_end = match.end('badge')
+            elif match.start() >= link_end:
+                links.append({'text': match.group('link_text'), 'url': match.group('link_url')})
+                link_end = match.end('link')
         
         # Add last section
         if current_section:
             sections.append({
                 'title': current_section,
-                'content': '\n'.join(current_content).strip()
+                'content': content[body_start:].strip()
             })
         
-        return sections
-    
-    def _extract_badges(self, content: str) -> List[str]:
-        """Extract badge URLs from markdown content."""
-        badge_pattern = r'!\[.*?\]\((https://.*?)\)'
-        return re.findall(badge_pattern, content)
-    
-    def _extract_links(self, content: str) -> List[Dict[str, str]]:
-        """Extract links from markdown content."""
-        link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-        matches = re.findall(link_pattern, content)
-        return [{'text': text, 'url': url} for text, url in matches]
+        return sections, badges, links
     
     def _parse_dependencies(self, repo_path: Path) -> Dict[str, Any]:
         """Parse dependency files for different languages."""
         dependencies = {}
+        root_names = self._root_names(repo_path)
         
         for language, files in self.dependency_files.items():
             for file_pattern in files:
                 if '*' in file_pattern:
-                    # Handle glob patterns
-                    matches = list(repo_path.glob(file_pattern))
+                    # Handle glob patterns against the root listing
+                    matches = sorted(fnmatch.filter(root_names, file_pattern))
                     for match in matches:
-                        deps = self._parse_dependency_file(match, language)
+                        deps = self._parse_dependency_file(repo_path / match, language)
                         if deps:
                             dependencies[language] = dependencies.get(language, {})
-                            dependencies[language][match.name] = deps
+                            dependencies[language][match] = deps
                 else:
                     # Handle exact file names
                     file_path = repo_path / file_pattern
-                    if file_path.exists():
+                    if file_pattern in root_names:
                         deps = self._parse_dependency_file(file_path, language)
                         if deps:
                             dependencies[language] = dependencies.get(language, {})
@@ -240,24 +587,33 @@ class RepoParser:
     def _parse_dependency_file(self, file_path: Path, language: str) -> Optional[Dict[str, Any]]:
         """Parse a specific dependency file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            if language == 'python':
-                return self._parse_python_deps(file_path, content)
-            elif language == 'node':
-                return self._parse_node_deps(file_path, content)
-            elif language == 'java':
-                return self._parse_java_deps(file_path, content)
-            # Add more parsers as needed
-            
-            return {'raw_content': content[:500]}  # Fallback
-            
+            return self._parse_cached(file_path, language,
+                                      lambda: self._read_dependency_file(file_path, language))
         except Exception as e:
             print(f"⚠️ Could not parse {file_path}: {e}")
             return None
     
-    def _parse_python_deps(self, file_path: Path, content: str) -> Dict[str, Any]:
+    def _read_dependency_file(self, file_path: Path, language: str) -> Dict[str, Any]:
+        """Read and parse a dependency file with its language's parser."""
+        if file_path.name == 'package.json':
+            # Parsed straight from the bytes, skipping the text decode
+            with open(file_path, 'rb') as f:
+                content = f.read()
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        
+        if language == 'python':
+            return self._parse_python_deps(file_path, content)
+        elif language == 'node':
+            return self._parse_node_deps(file_path, content)
+        elif language == 'java':
+            return self._parse_java_deps(file_path, content)
+        # Add more parsers as needed
+        
+        return {'raw_content': content[:500]}  # Fallback
+    
+    def _parse_python_deps(self, file_path: Path, content: Union[str, bytes]) -> Dict[str, Any]:
         """Parse Python dependency files."""
         if file_path.name == 'requirements.txt':
             deps = []
@@ -269,7 +625,7 @@ class RepoParser:
         
         elif file_path.name == 'package.json':
             try:
-                data = json.loads(content)
+                data = _loads_json(content)
                 return {
                     'dependencies': data.get('dependencies', {}),
                     'dev_dependencies': data.get('devDependencies', {}),
@@ -280,11 +636,11 @@ class RepoParser:
         
         return {'raw_content': content[:500]}
     
-    def _parse_node_deps(self, file_path: Path, content: str) -> Dict[str, Any]:
+    def _parse_node_deps(self, file_path: Path, content: Union[str, bytes]) -> Dict[str, Any]:
         """Parse Node.js dependency files."""
         if file_path.name == 'package.json':
             try:
-                data = json.loads(content)
+                data = _loads_json(content)
                 return {
                     'name': data.get('name'),
                     'version': data.get('version'),
@@ -305,51 +661,13 @@ class RepoParser:
     
     def _detect_languages(self, repo_path: Path) -> Dict[str, int]:
         """Detect programming languages used in the repository."""
-        language_extensions = {
-            'python': ['.py', '.pyw'],
-            'javascript': ['.js', '.jsx', '.mjs'],
-            'typescript': ['.ts', '.tsx'],
-            'java': ['.java'],
-            'go': ['.go'],
-            'rust': ['.rs'],
-            'cpp': ['.cpp', '.cc', '.cxx', '.c++'],
-            'c': ['.c'],
-            'csharp': ['.cs'],
-            'php': ['.php'],
-            'ruby': ['.rb'],
-            'swift': ['.swift'],
-            'kotlin': ['.kt', '.kts'],
-            'scala': ['.scala'],
-            'html': ['.html', '.htm'],
-            'css': ['.css', '.scss', '.sass'],
-            'shell': ['.sh', '.bash', '.zsh'],
-            'yaml': ['.yml', '.yaml'],
-            'json': ['.json'],
-            'xml': ['.xml'],
-            'markdown': ['.md', '.markdown']
-        }
-        
-        language_counts = {}
-        
-        for file_path in repo_path.rglob('*'):
-            if file_path.is_file():
-                suffix = file_path.suffix.lower()
-                for language, extensions in language_extensions.items():
-                    if suffix in extensions:
-                        language_counts[language] = language_counts.get(language, 0) + 1
-                        break
-        
+        language_counts = self._walk_once(repo_path).language_counts
         return dict(sorted(language_counts.items(), key=lambda x: x[1], reverse=True))
     
     def _find_config_files(self, repo_path: Path) -> List[str]:
         """Find configuration files in the repository."""
-        found_configs = []
-        
-        for config_file in self.config_files:
-            if (repo_path / config_file).exists():
-                found_configs.append(config_file)
-        
-        return found_configs
+        root_names = self._root_names(repo_path)
+        return [config_file for config_file in self.config_files if config_file in root_names]
     
     def _find_entry_points(self, repo_path: Path) -> List[str]:
         """Find potential entry points (main files)."""
@@ -363,8 +681,9 @@ class RepoParser:
             'main.rs'
         ]
         
+        root_names = self._root_names(repo_path)
         for entry_point in common_entry_points:
-            if (repo_path / entry_point).exists():
+            if entry_point in root_names:
                 entry_points.append(entry_point)
         
         return entry_points
@@ -388,8 +707,8 @@ class RepoParser:
         
         return docs
     
-    def _find_tests(self, repo_path: Path) -> Dict[str, Any]:
-        """Find test files and directories."""
+    def _find_tests(self, repo_path: Path, dependencies: Dict[str, Any]) -> Dict[str, Any]:
+        """Find test files, directories and frameworks."""
         test_info = {
             'directories': [],
             'files': [],
@@ -403,27 +722,70 @@ class RepoParser:
             if dir_path.exists() and dir_path.is_dir():
                 test_info['directories'].append(test_dir)
         
+        walk = self._walk_once(repo_path)
+        
         # Test files
-        test_patterns = ['*test*.py', '*_test.py', 'test_*.py', '*.test.js', '*.spec.js']
-        for pattern in test_patterns:
-            matches = list(repo_path.rglob(pattern))
-            test_info['files'].extend([str(m.relative_to(repo_path)) for m in matches])
+        test_info['files'].extend(walk.test_files)
         
-        # Test frameworks (basic detection)
-        if any('pytest' in str(f) for f in repo_path.rglob('*')):
+        # Test frameworks, from parsed dependencies and known config files
+        if self._uses_pytest(repo_path, dependencies):
             test_info['frameworks'].append('pytest')
-        if any('jest' in str(f) for f in repo_path.rglob('*')):
+        if self._uses_jest(repo_path, dependencies):
             test_info['frameworks'].append('jest')
         
         return test_info
     
+    def _uses_pytest(self, repo_path: Path, dependencies: Dict[str, Any]) -> bool:
+        """Check requirements.txt and pytest config files for pytest."""
+        requirements = dependencies.get('python', {}).get('requirements.txt', {})
+        for requirement in requirements.get('dependencies', []):
+            match = _REQUIREMENT_NAME_RE.match(requirement)
+            if match and match.group().lower().startswith('pytest'):
+                return True
+        
+        root_names = self._root_names(repo_path)
+        if any(name in root_names for name in _PYTEST_CONFIG_FILES):
+            return True
+        
+        for name, section in _PYTEST_SECTION_FILES.items():
+            if name not in root_names:
+                continue
+            try:
+                with open(repo_path / name, 'r', encoding='utf-8', errors='ignore') as f:
+                    if section in f.read():
+                        return True
+            except OSError:
+                continue
+        
+        return False
+    
+    def _uses_jest(self, repo_path: Path, dependencies: Dict[str, Any]) -> bool:
+        """Check package.json and jest config files for jest."""
+        package = dependencies.get('node', {}).get('package.json', {})
+        if 'jest' in package.get('dependencies', {}) or 'jest' in package.get('dev_dependencies', {}):
+            return True
+        if any('jest' in str(command) for command in package.get('scripts', {}).values()):
+            return True
+        
+        root_names = self._root_names(repo_path)
+        return any(name in root_names for name in _JEST_CONFIG_FILES)
+    
     def _find_ci_cd(self, repo_path: Path) -> List[str]:
         """Find CI/CD configuration files."""
         ci_cd_files = []
         
-        ci_patterns = [
-            '.github/workflows/*.yml',
-            '.github/workflows/*.yaml',
+        # GitHub Actions workflows, .yml before .yaml
+        workflows_dir = repo_path / '.github' / 'workflows'
+        try:
+            with os.scandir(workflows_dir) as it:
+                workflows = [entry.name for entry in it if entry.is_file()]
+        except OSError:
+            workflows = []
+        for suffix in ('.yml', '.yaml'):
+            ci_cd_files.extend(os.path.join('.github', 'workflows', name)
+                               for name in workflows if name.endswith(suffix))
+        
+        ci_files = [
             '.gitlab-ci.yml',
             '.travis.yml',
             'circle.yml',
@@ -431,9 +793,10 @@ class RepoParser:
             'azure-pipelines.yml'
         ]
         
-        for pattern in ci_patterns:
-            matches = list(repo_path.glob(pattern))
-            ci_cd_files.extend([str(m.relative_to(repo_path)) for m in matches])
+        root_names = self._root_names(repo_path)
+        for ci_file in ci_files:
+            if ci_file in root_names:
+                ci_cd_files.append(ci_file)
         
         return ci_cd_files
     
@@ -441,41 +804,18 @@ class RepoParser:
         """Find license file."""
         license_files = ['LICENSE', 'LICENSE.txt', 'LICENSE.md', 'COPYING']
         
-        for license_file in license_files:
-            license_path = repo_path / license_file
-            if license_path.exists():
-                return license_file
-        
-        return None
+        root_names = self._root_names(repo_path)
+        return next((name for name in license_files if name in root_names), None)
     
     def _calculate_statistics(self, repo_path: Path) -> Dict[str, int]:
         """Calculate basic repository statistics."""
-        stats = {
-            'total_files': 0,
-            'total_directories': 0,
-            'total_lines': 0,
-            'code_files': 0
+        walk = self._walk_once(repo_path)
+        return {
+            'total_files': walk.total_files,
+            'total_directories': walk.total_dirs,
+            'total_lines': walk.code_line_total,
+            'code_files': walk.code_files
         }
-        
-        code_extensions = {'.py', '.js', '.ts', '.java', '.go', '.rs', '.cpp', '.c', '.cs', '.php', '.rb'}
-        
-        for item in repo_path.rglob('*'):
-            if item.is_file():
-                stats['total_files'] += 1
-                
-                if item.suffix.lower() in code_extensions:
-                    stats['code_files'] += 1
-                    
-                    try:
-                        with open(item, 'r', encoding='utf-8') as f:
-                            stats['total_lines'] += sum(1 for _ in f)
-                    except (UnicodeDecodeError, PermissionError):
-                        pass  # Skip binary or inaccessible files
-            
-            elif item.is_dir():
-                stats['total_directories'] += 1
-        
-        return stats
 
 
 if __name__ == "__main__":
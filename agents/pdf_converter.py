@@ -11,6 +11,131 @@ import os
 from pathlib import Path
 from typing import Optional
 
+# Styled HTML document wrapped around converted markdown
+_HTML_HEAD = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Project Documentation</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            color: #333;
+        }
+        h1, h2, h3, h4, h5, h6 {
+            color: #2c3e50;
+            margin-top: 2em;
+            margin-bottom: 0.5em;
+        }
+        h1 {
+            border-bottom: 3px solid #3498db;
+            padding-bottom: 10px;
+        }
+        h2 {
+            border-bottom: 2px solid #ecf0f1;
+            padding-bottom: 5px;
+        }
+        code {
+            background-color: #f8f9fa;
+            padding: 2px 4px;
+            border-radius: 3px;
+            font-family: 'Monaco', 'Menlo', monospace;
+            color: #e74c3c;
+        }
+        pre {
+            background-color: #f8f9fa;
+            padding: 15px;
+            border-radius: 5px;
+            overflow-x: auto;
+            border-left: 4px solid #3498db;
+        }
+        pre code {
+            color: #333;
+            background: none;
+            padding: 0;
+        }
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            margin: 1em 0;
+        }
+        th, td {
+            border: 1px solid #ddd;
+            padding: 8px;
+            text-align: left;
+        }
+        th {
+            background-color: #f2f2f2;
+        }
+        @media print {
+            body {
+                max-width: none;
+                margin: 0;
+                padding: 15px;
+            }
+            h1, h2, h3, h4, h5, h6 {
+                page-break-after: avoid;
+            }
+        }
+    </style>
+</head>
+<body>
+'''
+_HTML_TAIL = '''
+</body>
+</html>'''
+
+# Optional PDF backends, imported once on first use; False once an import failed
+_weasyprint = None
+_reportlab = None
+
+# Patterns for the dependency-free markdown to HTML fallback
+_FENCE_RE = re.compile(r'^```([\s\S]*?)```', re.MULTILINE)
+_HEADER_RE = re.compile(r'^(#{1,6})[ \t]+(.*)$', re.MULTILINE)
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.*?)\*')
+_INLINE_CODE_RE = re.compile(r'`(.*?)`')
+
+# Headers recognised by the reportlab story builder and their styles
+_STORY_HEADER_RE = re.compile(r'(#{1,3}) (.*)')
+_HEADER_STYLES = {1: 'Title', 2: 'Heading1', 3: 'Heading2'}
+
+
+def _load_weasyprint():
+    """Import weasyprint on first use; returns None if it is missing or broken."""
+    global _weasyprint
+    if _weasyprint is None:
+        try:
+            import weasyprint
+        except (ImportError, OSError):  # OSError: native libraries such as Pango are missing
+            weasyprint = False
+        _weasyprint = weasyprint
+    return _weasyprint or None
+
+
+def _reportlab_available() -> bool:
+    """Check once whether the reportlab modules used for conversion import."""
+    global _reportlab
+    if _reportlab is None:
+        try:
+            from reportlab.pdfgen import canvas
+            from reportlab.lib.pagesizes import letter
+            _reportlab = True
+        except (ImportError, OSError):
+            _reportlab = False
+    return _reportlab
+
+
+def _header_to_html(match: re.Match) -> str:
+    """Render a markdown header match as the matching <hN> element."""
+    level = len(match.group(1))
+    return f'<h{level}>{match.group(2)}</h{level}>'
+
 
 class PythonPDFConverter:
     """Fallback PDF converter using pure Python libraries."""
@@ -18,10 +143,15 @@ class PythonPDFConverter:
     def __init__(self, output_dir="outputs"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        
-        # Check for available libraries
-        self.weasyprint_available = self._check_weasyprint()
-        self.reportlab_available = self._check_reportlab()
+    
+    # Available libraries, checked with a real import on first use and cached per process
+    @property
+    def weasyprint_available(self) -> bool:
+        return _load_weasyprint() is not None
+    
+    @property
+    def reportlab_available(self) -> bool:
+        return _reportlab_available()
     
     def convert_markdown_to_pdf(self, markdown_content: str, output_filename: str = "project_doc.pdf") -> str:
         """
@@ -41,27 +171,10 @@ class PythonPDFConverter:
         else:
             return self._convert_with_html_fallback(markdown_content, output_filename)
     
-    def _check_weasyprint(self) -> bool:
-        """Check if weasyprint is available."""
-        try:
-            import weasyprint
-            return True
-        except ImportError:
-            return False
-    
-    def _check_reportlab(self) -> bool:
-        """Check if reportlab is available."""
-        try:
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter
-            return True
-        except ImportError:
-            return False
-    
     def _convert_with_weasyprint(self, markdown_content: str, output_filename: str) -> str:
         """Convert using weasyprint (best quality)."""
         try:
-            import weasyprint
+            weasyprint = _load_weasyprint()
             from markdown import markdown
             
             # Convert markdown to HTML
@@ -97,21 +210,29 @@ class PythonPDFConverter:
             styles = getSampleStyleSheet()
             story = []
             
-            # Parse markdown content into paragraphs
-            lines = markdown_content.split('\n')
-            for line in lines:
+            # Parse markdown content into paragraphs, one per block of text lines
+            paragraph_lines = []
+            
+            def flush_paragraph():
+                if paragraph_lines:
+                    story.append(Paragraph('\n'.join(paragraph_lines), styles['Normal']))
+                    paragraph_lines.clear()
+            
+            for line in markdown_content.split('\n'):
                 line = line.strip()
                 if not line:
+                    flush_paragraph()
                     story.append(Spacer(1, 12))
-                elif line.startswith('# '):
-                    story.append(Paragraph(line[2:], styles['Title']))
-                elif line.startswith('## '):
-                    story.append(Paragraph(line[3:], styles['Heading1']))
-                elif line.startswith('### '):
-                    story.append(Paragraph(line[4:], styles['Heading2']))
+                    continue
+                
+                header = _STORY_HEADER_RE.fullmatch(line)
+                if header:
+                    flush_paragraph()
+                    story.append(Paragraph(header.group(2), styles[_HEADER_STYLES[len(header.group(1))]]))
                 else:
-                    story.append(Paragraph(line, styles['Normal']))
+                    paragraph_lines.append(line)
             
+            flush_paragraph()
             doc.build(story)
             
             print(f"✅ PDF generated with ReportLab: {pdf_path}")
@@ -141,23 +262,16 @@ class PythonPDFConverter:
     
     def _basic_markdown_to_html(self, markdown_text: str) -> str:
         """Convert basic markdown to HTML without external dependencies."""
-        html = markdown_text
-        
-        # Convert headers
-        html = re.sub(r'^# (.*?)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-        html = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-        html = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-        html = re.sub(r'^#### (.*?)$', r'<h4>\1</h4>', html, flags=re.MULTILINE)
-        
-        # Convert bold and italic
-        html = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', html)
-        html = re.sub(r'\*(.*?)\*', r'<em>\1</em>', html)
-        
-        # Convert inline code
-        html = re.sub(r'`(.*?)`', r'<code>\1</code>', html)
-        
-        # Convert code blocks
-        html = re.sub(r'^```([\s\S]*?)```', r'<pre><code>\1</code></pre>', html, flags=re.MULTILINE)
+        # Convert code blocks first so the text rules below leave their
+        # contents alone
+        parts = []
+        position = 0
+        for fence in _FENCE_RE.finditer(markdown_text):
+            parts.append(self._basic_text_to_html(markdown_text[position:fence.start()]))
+            parts.append(f'<pre><code>{fence.group(1)}</code></pre>')
+            position = fence.end()
+        parts.append(self._basic_text_to_html(markdown_text[position:]))
+        html = ''.join(parts)
         
         # Convert paragraphs
         paragraphs = html.split('\n\n')
@@ -171,84 +285,21 @@ class PythonPDFConverter:
         
         return '\n'.join(html_paragraphs)
     
+    def _basic_text_to_html(self, text: str) -> str:
+        """Convert headers and inline markdown outside of code blocks."""
+        # Convert headers
+        text = _HEADER_RE.sub(_header_to_html, text)
+        
+        # Convert bold and italic
+        text = _BOLD_RE.sub(r'<strong>\1</strong>', text)
+        text = _ITALIC_RE.sub(r'<em>\1</em>', text)
+        
+        # Convert inline code
+        return _INLINE_CODE_RE.sub(r'<code>\1</code>', text)
+    
     def _create_styled_html(self, html_content: str) -> str:
         """Create a complete HTML document with styling."""
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Project Documentation</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            color: #333;
-        }}
-        h1, h2, h3, h4, h5, h6 {{
-            color: #2c3e50;
-            margin-top: 2em;
-            margin-bottom: 0.5em;
-        }}
-        h1 {{
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            border-bottom: 2px solid #ecf0f1;
-            padding-bottom: 5px;
-        }}
-        code {{
-            background-color: #f8f9fa;
-            padding: 2px 4px;
-            border-radius: 3px;
-            font-family: 'Monaco', 'Menlo', monospace;
-            color: #e74c3c;
-        }}
-        pre {{
-            background-color: #f8f9fa;
-            padding: 15px;
-            border-radius: 5px;
-            overflow-x: auto;
-            border-left: 4px solid #3498db;
-        }}
-        pre code {{
-            color: #333;
-            background: none;
-            padding: 0;
-        }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 1em 0;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #f2f2f2;
-        }}
-        @media print {{
-            body {{
-                max-width: none;
-                margin: 0;
-                padding: 15px;
-            }}
-            h1, h2, h3, h4, h5, h6 {{
-                page-break-after: avoid;
-            }}
-        }}
-    </style>
-</head>
-<body>
-{html_content}
-</body>
-</html>'''
+        return _HTML_HEAD + html_content + _HTML_TAIL
 
 
 if __name__ == "__main__":
@@ -2,88 +2,496 @@
 """
 Repo Cloner Agent
 
-Handles cloning GitHub repositories using GitPython.
+Handles cloning GitHub repositories and reading their metadata with the
+git CLI.
 Follows DX best practices with error handling and cleanup.
 """
 
+import asyncio
+import logging
 import os
+import re
 import shutil
+import stat
+import subprocess
+import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urlparse
 
-try:
-    import git
-except ImportError:
-    print("GitPython not found. Install with: pip install GitPython")
-    raise
+logger = logging.getLogger(__name__)
+
+# Shallow clone of the default branch only
+_CLONE_ARGS = ['--quiet', '--depth=1', '--single-branch']
+
+# Let git size its pack, index and fetch thread pools to the CPU count
+_GIT_PARALLEL_CONFIG = ['-c', 'pack.threads=0', '-c', 'index.threads=0', '-c', 'fetch.parallel=0']
+
+# "Name <email> <unix time> <+hhmm>" identity line of a commit object
+_IDENTITY_RE = re.compile(rb'(.*) <.*> (\d+) ([+-])(\d\d)(\d\d)')
+
+# http(s)://[www.]github.com/<owner>/<repo>[.git][/], using GitHub's name
+# charsets; the reserved repo names "." and ".." are rejected
+_GITHUB_URL_RE = re.compile(r'https?://(?:www\.)?github\.com/([A-Za-z0-9-]+)/'
+                            r'(?!\.{1,2}(?:\.git)?/?\Z)([A-Za-z0-9_.-]+?)(?:\.git)?/?')
+
+
+@lru_cache(maxsize=1024)
+def _parse_github(url):
+    """
+    Extract owner and repository name from a GitHub URL, memoized per URL.
+    
+    Args:
+        url (str): Repository URL
+        
+    Returns:
+        tuple: (owner, repo) with any .git suffix removed, or None if the
+               URL is not a GitHub repository URL
+    """
+    match = _GITHUB_URL_RE.fullmatch(url)
+    return match.groups() if match else None
+
+
+def _group_by_repo(urls):
+    """
+    Group URLs that name the same repository, so each one is cloned once.
+    
+    GitHub owner and repo names are case-insensitive, and a .git suffix or
+    trailing slash does not change the repository.
+    
+    Args:
+        urls (Iterable[str]): Repository URLs
+        
+    Returns:
+        dict: Maps (owner, repo) in lowercase, or the raw value if it is not a
+              GitHub URL, to the distinct URLs naming it in input order
+    """
+    groups = {}
+    for url in dict.fromkeys(urls):
+        parsed = _parse_github(url) if isinstance(url, str) else None
+        key = (parsed[0].lower(), parsed[1].lower()) if parsed else url
+        groups.setdefault(key, []).append(url)
+    return groups
+
+
+def _fast_rmtree(path):
+    """
+    Remove a directory tree with the platform's native recursive delete.
+    
+    ``rm -rf`` (or ``rd /s /q`` on Windows) removes large ``.git`` object
+    stores much faster than a Python-level walk. Falls back to
+    ``_scandir_rmtree`` when the command is missing or leaves the tree behind,
+    so failures still raise.
+    
+    Args:
+        path (Path): Directory to remove
+    """
+    path = str(path)
+    if sys.platform == 'win32':
+        cmd = ['cmd', '/c', 'rd', '/s', '/q', path]
+    else:
+        cmd = ['rm', '-rf', '--', path]
+    
+    if shutil.which(cmd[0]):
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if result.returncode == 0 and not os.path.lexists(path):
+            return
+    
+    _scandir_rmtree(path)
+
+
+def _scandir_rmtree(path):
+    """
+    Remove a directory tree with a single ``os.scandir`` pass per directory.
+    
+    ``DirEntry.is_dir`` answers from the directory listing, so no file is
+    stat'ed separately. Symlinks are unlinked, never followed.
+    
+    Args:
+        path (str): Directory to remove
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scandir_rmtree(entry.path)
+                continue
+            try:
+                os.unlink(entry.path)
+            except PermissionError:
+                # git marks pack files read-only, which blocks deletion on Windows
+                os.chmod(entry.path, stat.S_IWRITE)
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _run_git(repo_path, *args):
+    """Run a git command in repo_path and capture its text output."""
+    return subprocess.run(['git', '-C', str(repo_path), *args], capture_output=True, text=True)
+
+
+def _parse_identity(line):
+    """
+    Split a commit author or committer line into name and timestamp.
+    
+    Args:
+        line (bytes): Identity value, e.g. b"Jane <jane@x.org> 1700000000 +0100"
+        
+    Returns:
+        tuple: (name, timezone-aware datetime)
+    """
+    match = _IDENTITY_RE.fullmatch(line)
+    if not match:
+        raise ValueError(f"Malformed identity line: {line!r}")
+    name, seconds, sign, hours, minutes = match.groups()
+    offset = timedelta(hours=int(hours), minutes=int(minutes))
+    tz = timezone(-offset if sign == b'-' else offset)
+    return name.decode('utf-8', 'replace'), datetime.fromtimestamp(int(seconds), tz)
+
+
+class _GitBatch:
+    """Persistent ``git cat-file --batch`` process reading objects of one repository."""
+    
+    def __init__(self, repo_path):
+        self._proc = subprocess.Popen(['git', '-C', str(repo_path), 'cat-file', '--batch'],
+                                      stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL)
+        self._lock = threading.Lock()
+    
+    def read(self, rev):
+        """
+        Read one object in a single request/response round trip.
+        
+        Args:
+            rev (str): Object name, e.g. 'HEAD' or a SHA
+            
+        Returns:
+            tuple: (sha, type, raw bytes), or None if rev does not resolve
+        """
+        with self._lock:
+            self._proc.stdin.write(rev.encode('utf-8') + b'\n')
+            self._proc.stdin.flush()
+            header = self._proc.stdout.readline().split()
+            if len(header) != 3:
+                return None  # "<rev> missing" or the process has exited
+            sha, obj_type, size = header
+            data = self._proc.stdout.read(int(size))
+            self._proc.stdout.read(1)  # Trailing newline
+        return sha.decode('ascii'), obj_type.decode('ascii'), data
+    
+    def close(self):
+        """Stop the git process."""
+        if self._proc.poll() is None:
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+            self._proc.wait()
 
 
 class RepoCloner:
     """Agent responsible for cloning GitHub repositories."""
     
-    def __init__(self, temp_dir=None):
+    def __init__(self, temp_dir=None, use_cache=False):
         self.temp_dir = temp_dir or tempfile.gettempdir()
-        self.cloned_repos = []  # Track for cleanup
+        self.cloned_repos = set()  # Track for cleanup
+        self._lock = threading.Lock()  # Guards cloned_repos across clone threads
+        self._batches = {}  # Repo path -> _GitBatch, closed on cleanup
+        self._root = None  # Per-instance clone directory, created on first clone
+        
+        # Cached clones persist across runs and are refreshed with a fetch
+        self.use_cache = use_cache
+        self.cache_dir = Path(self.temp_dir) / "gitread_cache"
     
-    def clone_repo(self, github_url, target_dir=None):
+    def clone_repo(self, github_url, target_dir=None, blobless=False, bare=False):
         """
         Clone a GitHub repository to a temporary or specified directory.
         
+        Clones default to a private directory created once per instance, so
+        separate cloners never collide. With use_cache, they default to the
+        cache directory instead, and an existing checkout of the same repository is updated in place with a
+        shallow fetch instead of being deleted and cloned again.
+        
+        Args:
+            github_url (str): GitHub repository URL
+            target_dir (str, optional): Target directory for cloning
+            blobless (bool): Skip file contents (--filter=blob:none); git
+                             fetches blobs on demand when they are read
+            bare (bool): Clone without a working tree, for metadata-only use
+            
+        Returns:
+            Path: Path to the cloned repository
+            
+        Raises:
+            ValueError: If URL is invalid
+            subprocess.CalledProcessError: If cloning fails
+        """
+        target_dir = self._clone_target(github_url, target_dir)
+        
+        # Reuse a cached checkout of the same repository
+        if self.use_cache and self._update_cached(target_dir, github_url):
+            return target_dir
+        
+        # Remove existing directory if it exists
+        if target_dir.exists():
+            _fast_rmtree(target_dir)
+        
+        try:
+            logger.info("Cloning %s to %s...", github_url, target_dir)
+            subprocess.run(self._clone_command(github_url, target_dir, blobless, bare),
+                           check=True, capture_output=True, text=True)
+        except BaseException as e:
+            self._clone_failed(target_dir, e)
+            raise
+        
+        return self._clone_done(target_dir)
+    
+    async def clone_repo_async(self, github_url, target_dir=None, blobless=False, bare=False):
+        """
+        Clone a GitHub repository without blocking the event loop.
+        
+        Same behaviour as clone_repo, but git runs through
+        asyncio.create_subprocess_exec, so many clones can overlap on one
+        event loop instead of holding a thread each.
+        
         Args:
             github_url (str): GitHub repository URL
             target_dir (str, optional): Target directory for cloning
+            blobless (bool): See clone_repo
+            bare (bool): See clone_repo
             
         Returns:
             Path: Path to the cloned repository
             
         Raises:
             ValueError: If URL is invalid
-            git.GitCommandError: If cloning fails
+            subprocess.CalledProcessError: If cloning fails
         """
+        target_dir = self._clone_target(github_url, target_dir)
+        loop = asyncio.get_running_loop()
+        
+        # Cache updates and deletes are short local git/filesystem calls
+        if self.use_cache and await loop.run_in_executor(None, self._update_cached, target_dir, github_url):
+            return target_dir
+        if target_dir.exists():
+            await loop.run_in_executor(None, _fast_rmtree, target_dir)
+        
+        cmd = self._clone_command(github_url, target_dir, blobless, bare)
+        try:
+            logger.info("Cloning %s to %s...", github_url, target_dir)
+            proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.DEVNULL,
+                                                        stderr=asyncio.subprocess.PIPE)
+            try:
+                _, stderr = await proc.communicate()
+            finally:
+                if proc.returncode is None:  # Cancelled mid-clone
+                    proc.kill()
+                    await proc.wait()
+            if proc.returncode:
+                raise subprocess.CalledProcessError(proc.returncode, cmd,
+                                                    stderr=stderr.decode('utf-8', 'replace'))
+        except BaseException as e:
+            self._clone_failed(target_dir, e)
+            raise
+        
+        return self._clone_done(target_dir)
+    
+    def _clone_target(self, github_url, target_dir):
+        """Validate github_url and resolve the directory it is cloned into."""
         # Validate GitHub URL
         if not self._is_valid_github_url(github_url):
             raise ValueError(f"Invalid GitHub URL: {github_url}")
         
         # Determine target directory
-        if target_dir is None:
-            repo_name = self._extract_repo_name(github_url)
-            target_dir = Path(self.temp_dir) / f"gitread_{repo_name}"
-        else:
-            target_dir = Path(target_dir)
+        if target_dir is not None:
+            return Path(target_dir)
+        if self.use_cache:
+            owner, repo_name = _parse_github(github_url)
+            return self.cache_dir / f"{owner}_{repo_name}"
+        # Owner and repo together, so same-named repos of different owners never share a target
+        root = self._clone_root()
+        owner, repo_name = _parse_github(github_url)
+        target_dir = root / f"{owner}_{repo_name}"
+        # The target is deleted before cloning, so it must stay inside the root
+        if repo_name in ('', '.', '..') or target_dir.resolve().parent != root.resolve():
+            raise ValueError(f"Unsafe repository name in URL: {github_url}")
+        return target_dir
+    
+    def _clone_root(self):
+        """Return this instance's private clone directory, creating it on first use."""
+        with self._lock:
+            if self._root is None:
+                self._root = Path(tempfile.mkdtemp(prefix="gitread_", dir=self.temp_dir))
+            return self._root
+    
+    def _clone_command(self, github_url, target_dir, blobless, bare):
+        """Build the git clone command line; shallow clone for efficiency."""
+        clone_args = list(_CLONE_ARGS)
+        if blobless:
+            clone_args.append('--filter=blob:none')
+        if bare:
+            clone_args.append('--bare')
+        return ['git', *_GIT_PARALLEL_CONFIG, 'clone', *clone_args, github_url, str(target_dir)]
+    
+    def _clone_done(self, target_dir):
+        """Track a finished clone for cleanup; cached clones are kept."""
+        if not self._is_cached(target_dir):
+            with self._lock:
+                self.cloned_repos.add(target_dir)
         
-        # Remove existing directory if it exists
+        logger.info("✅ Successfully cloned to %s", target_dir)
+        return target_dir
+    
+    def _clone_failed(self, target_dir, error):
+        """Log a failed clone and remove whatever it left behind."""
+        if isinstance(error, subprocess.CalledProcessError):
+            logger.error("❌ Failed to clone repository: %s", (error.stderr or '').strip() or error)
+        elif isinstance(error, Exception):
+            logger.error("❌ Unexpected error during cloning: %s", error)
+        # Clean up partial clone if it exists
         if target_dir.exists():
-            shutil.rmtree(target_dir)
+            _fast_rmtree(target_dir)
+    
+    def _update_cached(self, target_dir, github_url):
+        """
+        Bring an existing checkout of github_url up to date with a shallow fetch.
         
-        try:
-            print(f"Cloning {github_url} to {target_dir}...")
+        Args:
+            target_dir (Path): Existing clone location
+            github_url (str): GitHub repository URL
             
-            # Clone repository with shallow clone for efficiency
-            repo = git.Repo.clone_from(
-                github_url,
-                target_dir,
-                depth=1,  # Shallow clone
-                single_branch=True  # Only main/master branch
-            )
+        Returns:
+            bool: True if the checkout was updated, False if it must be cloned
+        """
+        if not (target_dir / '.git').is_dir() or not self._same_remote(target_dir, github_url):
+            return False
+        
+        logger.info("Updating cached clone of %s in %s...", github_url, target_dir)
+        try:
+            # Only fetch when the remote HEAD has moved; otherwise just restore the checkout
+            if self._remote_head_matches(target_dir):
+                commands = [['reset', '--quiet', '--hard', 'HEAD']]
+            else:
+                commands = [[*_GIT_PARALLEL_CONFIG, 'fetch', '--quiet', '--depth=1', 'origin'],
+                            ['reset', '--quiet', '--hard', 'FETCH_HEAD']]
+            for args in (*commands, ['clean', '--quiet', '-ffdx']):
+                subprocess.run(['git', '-C', str(target_dir), *args],
+                               check=True, capture_output=True, text=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning("⚠️ Could not update cached clone, cloning again: %s", e)
+            return False
+        
+        logger.info("✅ Cached clone up to date in %s", target_dir)
+        return True
+    
+    def _remote_head_matches(self, repo_path):
+        """
+        Check whether origin's HEAD is the commit already checked out.
+        
+        ``git ls-remote`` exchanges only the ref advertisement, so an
+        unchanged repository costs one round trip and no object transfer.
+        
+        Args:
+            repo_path (Path): Existing clone location
             
-            # Track for cleanup
-            self.cloned_repos.append(target_dir)
+        Returns:
+            bool: True if the local and remote HEAD SHAs are equal
+        """
+        remote = _run_git(repo_path, 'ls-remote', '--exit-code', 'origin', 'HEAD')
+        local = _run_git(repo_path, 'rev-parse', '--verify', '--quiet', 'HEAD')
+        if remote.returncode != 0 or local.returncode != 0:
+            return False
+        remote_sha = remote.stdout.split('\t', 1)[0].strip()
+        return bool(remote_sha) and remote_sha == local.stdout.strip()
+    
+    def _same_remote(self, repo_path, github_url):
+        """Check whether the clone at repo_path has github_url as its origin."""
+        try:
+            result = _run_git(repo_path, 'config', '--get', 'remote.origin.url')
+        except OSError:
+            return False
+        origin = _parse_github(result.stdout.strip())
+        return origin is not None and origin == _parse_github(github_url)
+    
+    def _is_cached(self, repo_path):
+        """Check whether repo_path lives in the persistent clone cache."""
+        return self.use_cache and Path(repo_path).parent == self.cache_dir
+    
+    def clone_many(self, urls, max_workers=10, blobless=False, bare=False):
+        """
+        Clone several GitHub repositories concurrently.
+        
+        Runs clone_many_async on a new event loop. When called from a thread
+        that already runs an event loop, where asyncio.run is not allowed, the
+        clones run on a thread pool instead.
+        
+        Args:
+            urls (Iterable[str]): GitHub repository URLs; URLs naming the same
+                                  repository are cloned once
+            max_workers (int): Maximum number of concurrent clones
+            blobless (bool): Passed to clone_repo
+            bare (bool): Passed to clone_repo
             
-            print(f"✅ Successfully cloned to {target_dir}")
-            return target_dir
+        Returns:
+            dict: Maps each URL, in input order, to its cloned Path or the
+                  exception that stopped it
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.clone_many_async(urls, max_workers, blobless=blobless, bare=bare))
+        
+        results = dict.fromkeys(urls)
+        groups = list(_group_by_repo(results).values())
+        if not groups:
+            return results
+        
+        def clone(url):
+            try:
+                return self.clone_repo(url, blobless=blobless, bare=bare)
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+            outcomes = executor.map(clone, [group[0] for group in groups])
+            for group, outcome in zip(groups, outcomes):
+                results.update(dict.fromkeys(group, outcome))
+        return results
+    
+    async def clone_many_async(self, urls, max_concurrency=10, blobless=False, bare=False):
+        """
+        Clone several GitHub repositories concurrently on the running event loop.
+        
+        Each URL is cloned with clone_repo_async; a semaphore bounds how many
+        git processes run at once, so the batch is bound by aggregate
+        bandwidth rather than per-repository latency. A failed clone does not
+        abort the others.
+        
+        Args:
+            urls (Iterable[str]): GitHub repository URLs; URLs naming the same
+                                  repository are cloned once
+            max_concurrency (int): Maximum number of concurrent clones
+            blobless (bool): Passed to clone_repo_async
+            bare (bool): Passed to clone_repo_async
             
-        except git.GitCommandError as e:
-            print(f"❌ Failed to clone repository: {e}")
-            # Clean up partial clone if it exists
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-            raise
-        except Exception as e:
-            print(f"❌ Unexpected error during cloning: {e}")
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-            raise
+        Returns:
+            dict: Maps each URL, in input order, to its cloned Path or the
+                  exception that stopped it
+        """
+        results = dict.fromkeys(urls)
+        groups = list(_group_by_repo(results).values())
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def clone(url):
+            async with semaphore:
+                return await self.clone_repo_async(url, blobless=blobless, bare=bare)
+        
+        outcomes = await asyncio.gather(*(clone(group[0]) for group in groups), return_exceptions=True)
+        for group, outcome in zip(groups, outcomes):
+            results.update(dict.fromkeys(group, outcome))
+        return results
     
     def _is_valid_github_url(self, url):
         """
@@ -95,26 +503,7 @@ class RepoCloner:
         Returns:
             bool: True if valid GitHub URL
         """
-        try:
-            parsed = urlparse(url)
-            
-            # Check if it's a GitHub URL
-            if parsed.netloc not in ['github.com', 'www.github.com']:
-                return False
-            
-            # Check if path has at least owner/repo format
-            path_parts = parsed.path.strip('/').split('/')
-            if len(path_parts) < 2:
-                return False
-            
-            # Remove .git suffix if present
-            if path_parts[-1].endswith('.git'):
-                path_parts[-1] = path_parts[-1][:-4]
-            
-            return True
-            
-        except Exception:
-            return False
+        return isinstance(url, str) and _parse_github(url) is not None
     
     def _extract_repo_name(self, github_url):
         """
@@ -126,22 +515,17 @@ class RepoCloner:
         Returns:
             str: Repository name
         """
-        parsed = urlparse(github_url)
-        path_parts = parsed.path.strip('/').split('/')
-        
-        # Get repo name (last part of path)
-        repo_name = path_parts[-1]
-        
-        # Remove .git suffix if present
-        if repo_name.endswith('.git'):
-            repo_name = repo_name[:-4]
-        
-        return repo_name
+        parsed = _parse_github(github_url)
+        return parsed[1] if parsed else ''
+
     
     def get_repo_info(self, repo_path):
         """
         Get basic information about the cloned repository.
         
+        The HEAD commit is read through a persistent ``git cat-file --batch``
+        process kept per repository, so repeated calls cost one round trip.
+        
         Args:
             repo_path (Path): Path to the cloned repository
             
@@ -149,89 +533,149 @@ class RepoCloner:
             dict: Repository information
         """
         try:
-            repo = git.Repo(repo_path)
-            
-            # Get remote URL
-            remote_url = None
-            if repo.remotes:
-                remote_url = repo.remotes.origin.url
+            # Get latest commit info
+            head = self._git_batch(repo_path).read('HEAD')
+            if head is None or head[1] != 'commit':
+                raise ValueError(f"No commit at HEAD in {repo_path}")
+            sha, _, data = head
+            headers, _, message = data.partition(b'\n\n')
+            fields = dict(line.split(b' ', 1) for line in reversed(headers.split(b'\n'))
+                          if line[:1] != b' ' and b' ' in line)
+            author, _ = _parse_identity(fields[b'author'])
+            _, committed_datetime = _parse_identity(fields[b'committer'])
             
-            # Get current branch
-            current_branch = repo.active_branch.name if repo.active_branch else 'detached'
+            # Get current branch and dirty state; bare clones have no work tree
+            status = _run_git(repo_path, 'status', '--porcelain=v2', '--branch', '--untracked-files=no')
+            if status.returncode == 0:
+                lines = status.stdout.splitlines()
+                branch = next((line[len('# branch.head '):] for line in lines
+                               if line.startswith('# branch.head ')), '(detached)')
+                is_dirty = any(not line.startswith('#') for line in lines)
+            else:
+                branch = _run_git(repo_path, 'symbolic-ref', '--quiet', '--short', 'HEAD').stdout.strip()
+                is_dirty = False
+            current_branch = branch if branch and branch != '(detached)' else 'detached'
             
-            # Get latest commit info
-            latest_commit = repo.head.commit
+            # Get remote URL
+            remote_url = _run_git(repo_path, 'config', '--get', 'remote.origin.url').stdout.strip() or None
             
             return {
                 'path': str(repo_path),
                 'remote_url': remote_url,
                 'current_branch': current_branch,
                 'latest_commit': {
-                    'sha': latest_commit.hexsha[:8],
-                    'message': latest_commit.message.strip(),
-                    'author': str(latest_commit.author),
-                    'date': latest_commit.committed_datetime.isoformat()
+                    'sha': sha[:8],
+                    'message': message.decode('utf-8', 'replace').strip(),
+                    'author': author,
+                    'date': committed_datetime.isoformat()
                 },
-                'is_dirty': repo.is_dirty()
+                'is_dirty': is_dirty
             }
             
         except Exception as e:
-            print(f"⚠️ Could not get repo info: {e}")
+            logger.warning("⚠️ Could not get repo info: %s", e)
             return {
                 'path': str(repo_path),
                 'error': str(e)
             }
     
+    def _git_batch(self, repo_path):
+        """Return the cat-file process for repo_path, starting it on first use."""
+        key = str(Path(repo_path).resolve())
+        with self._lock:
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = self._batches[key] = _GitBatch(key)
+        return batch
+    
+    def _close_batch(self, repo_path):
+        """Stop the cat-file process for repo_path, if one is running."""
+        with self._lock:
+            batch = self._batches.pop(str(Path(repo_path).resolve()), None)
+        if batch is not None:
+            batch.close()
+    
     def cleanup(self, repo_path=None):
         """
         Clean up cloned repositories.
         
         Args:
             repo_path (Path, optional): Specific repo to clean up.
-                                      If None, cleans up all tracked repos.
+                                      If None, cleans up all tracked repos
+                                      and removes the clone root at once.
         """
         if repo_path:
-            # Clean up specific repository
+            # Clean up specific repository; cached clones are kept for reuse
             repo_path = Path(repo_path)
+            self._close_batch(repo_path)
+            if self._is_cached(repo_path):
+                return
             if repo_path.exists():
                 try:
-                    shutil.rmtree(repo_path)
-                    print(f"🧹 Cleaned up {repo_path}")
-                    if repo_path in self.cloned_repos:
-                        self.cloned_repos.remove(repo_path)
+                    _fast_rmtree(repo_path)
+                    logger.info("🧹 Cleaned up %s", repo_path)
+                    with self._lock:
+                        self.cloned_repos.discard(repo_path)
                 except Exception as e:
-                    print(f"⚠️ Could not clean up {repo_path}: {e}")
+                    logger.warning("⚠️ Could not clean up %s: %s", repo_path, e)
+            
+            # Drop the clone root once its last clone is gone
+            with self._lock:
+                if self._root is not None and repo_path.parent == self._root:
+                    try:
+                        os.rmdir(self._root)
+                        self._root = None
+                    except OSError:
+                        pass  # Other clones remain
         else:
-            # Clean up all tracked repositories
-            for repo_path in self.cloned_repos.copy():
-                self.cleanup(repo_path)
+            # Clean up all tracked repositories; clones in the root go with it
+            with self._lock:
+                tracked = list(self.cloned_repos)
+                batches, self._batches = list(self._batches.values()), {}
+                root, self._root = self._root, None
+            for batch in batches:
+                batch.close()
+            for repo_path in tracked:
+                if repo_path.parent != root:
+                    self.cleanup(repo_path)
+            if root is not None:
+                try:
+                    _fast_rmtree(root)
+                    logger.info("🧹 Cleaned up %s", root)
+                    with self._lock:
+                        self.cloned_repos.difference_update(
+                            [repo_path for repo_path in tracked if repo_path.parent == root])
+                except Exception as e:
+                    logger.warning("⚠️ Could not clean up %s: %s", root, e)
+    
+    def __enter__(self):
+        return self
     
-    def __del__(self):
-        """Cleanup on object destruction."""
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Clean up all tracked repositories when the with block ends."""
         self.cleanup()
 
 
 if __name__ == "__main__":
     # Test the repo cloner
-    import sys
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     if len(sys.argv) != 2:
         print("Usage: python repo_cloner.py <github_url>")
         sys.exit(1)
     
     github_url = sys.argv[1]
-    cloner = RepoCloner()
     
     try:
-        repo_path = cloner.clone_repo(github_url)
-        repo_info = cloner.get_repo_info(repo_path)
-        
-        print("\n📊 Repository Information:")
-        for key, value in repo_info.items():
-            print(f"  {key}: {value}")
-        
-        input("\nPress Enter to cleanup...")
-        cloner.cleanup(repo_path)
+        with RepoCloner() as cloner:
+            repo_path = cloner.clone_repo(github_url)
+            repo_info = cloner.get_repo_info(repo_path)
+            
+            print("\n📊 Repository Information:")
+            for key, value in repo_info.items():
+                print(f"  {key}: {value}")
+            
+            input("\nPress Enter to cleanup...")
         
     except Exception as e:
         print(f"❌ Error: {e}")
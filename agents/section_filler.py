@@ -79,7 +79,7 @@ class SectionFiller:
             
             try:
                 # Get section prompt
-                section_prompt = prompts.get(title, '')
+                section_prompt = prompts.get(title, {})
                 
                 # Fill section content
                 content = self._fill_section(
@@ -120,7 +120,7 @@ class SectionFiller:
         priority_map = {'high': 1, 'medium': 2, 'low': 3}
         return priority_map.get(priority.lower(), 2)
     
-    def _fill_section(self, title: str, section: Dict[str, Any], prompt: str,
+    def _fill_section(self, title: str, section: Dict[str, Any], prompt: Dict[str, str],
                      repo_data: Dict[str, Any], ai_context: Dict[str, Any]) -> str:
         """
         Fill a specific section with content.
@@ -128,14 +128,15 @@ class SectionFiller:
         Args:
             title: Section title
             section: Section metadata
-            prompt: Generated prompt for this section
+            prompt: Generated prompt parts for this section
             repo_data: Repository data
             ai_context: AI learning context
             
         Returns:
             Generated section content
         """
-        # In a real implementation, this would call an LLM API
+        # In a real implementation, this would call an LLM API with
+        # doc_planner.build_cached_messages(prompt) so the shared prefix is cached
         # For now, we'll use template-based generation
         
         # Try to use AI context and learning materials
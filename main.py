@@ -12,6 +12,7 @@ with integrated testing, quality review, and iterative improvement capabilities.
 
 import os
 import sys
+import logging
 import argparse
 from pathlib import Path
 from datetime import datetime, timezone
@@ -225,12 +226,9 @@ class PromptSwitchAgent:
             
             # Step 6: Format and save final document (Prompt Chain: Formatting)
             print("📄 Formatting final document...")
-            final_doc = self.formatter.format_document(filled_doc)
-            
             # Save primary documentation (Markdown) in repository-specific folder
             output_path = repo_output_dir / base_filename
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(final_doc)
+            final_doc = self.formatter.format_to_path(filled_doc, output_path)
             
             pipeline_results['outputs']['documentation_path'] = str(output_path)
             print(f"✅ Documentation generated: {output_path}")
@@ -734,6 +732,10 @@ def main():
     
     args = parser.parse_args()
     
+    # Show agent progress messages (e.g. clone status) on the console; other libraries stay at WARNING
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logging.getLogger("agents").setLevel(logging.INFO)
+    
     # Initialize and run PromptSwitch v2 agent
     agent = PromptSwitchAgent(output_dir=args.output_dir, prompts_dir=args.prompts_dir)
     